@@ -0,0 +1,126 @@
+import math
+from typing import Dict, List
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+import tracker_config as tkc
+from logger_setup import logger
+from database.database_utility.query_log import query_log
+from database.database_utility.table_columns import TABLE_SLIDER_COLUMNS
+
+# anomaly_flags.py
+
+# Tables whose rows are scored on insert
+FLAGGED_TABLES = ("cspr_table", "mental_mental_table")
+
+# Sliders move in whole steps, so never treat a deviation of one step as extreme
+MIN_STD = 0.5
+
+
+def setup_slider_stats_table(query: QSqlQuery) -> None:
+    """
+    Creates the table holding the running statistics of each flagged slider, and adds
+    the anomaly_flag column to flagged tables created before it existed.
+
+    Args:
+        query (QSqlQuery): The query used by the DataManager.
+
+    Returns:
+        None
+    """
+    if not query_log.exec(query, """
+                        CREATE TABLE IF NOT EXISTS slider_stats_table (
+                        slider TEXT PRIMARY KEY,
+                        mean REAL NOT NULL,
+                        variance REAL NOT NULL,
+                        samples INTEGER NOT NULL
+                        ) WITHOUT ROWID"""):
+        logger.error(f"Error creating table: slider_stats_table {query.lastError().text()}")
+
+    for table_name in FLAGGED_TABLES:
+        columns = []
+        if query_log.exec(query, f"PRAGMA table_info({table_name})"):
+            while query.next():
+                columns.append(query.value(1))
+        if columns and "anomaly_flag" not in columns:
+            if not query_log.exec(query, f"ALTER TABLE {table_name} ADD COLUMN anomaly_flag INTEGER DEFAULT 0"):
+                logger.error(f"Error adding anomaly_flag to {table_name}: {query.lastError().text()}")
+
+
+class AnomalyScorer:
+    """
+    Scores inserted rows against an EWMA mean and variance per slider.
+
+    The statistics are read from slider_stats_table once, kept in memory and written
+    back one row per slider on every insert, so scoring and updating are O(1) and
+    never look at earlier rows.
+
+    The flag of a row is a bitmask: bit i is set when the i-th slider of the table,
+    in TABLE_SLIDER_COLUMNS order, lies more than ANOMALY_Z_THRESHOLD standard
+    deviations from its running mean.
+    """
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, List[float]] = {}
+        query = QSqlQuery(QSqlDatabase.database())
+        if not query_log.exec(query, "SELECT slider, mean, variance, samples FROM slider_stats_table"):
+            logger.error(f"Error loading slider statistics: {query.lastError().text()}")
+            return
+        while query.next():
+            self.stats[query.value(0)] = [query.value(1), query.value(2), query.value(3)]
+
+    def score(self, table_name: str, values: Dict[str, int]) -> int:
+        """
+        Computes the anomaly flag of a row without updating the statistics.
+
+        Args:
+            table_name (str): One of FLAGGED_TABLES.
+            values (Dict[str, int]): The row's slider values by column name.
+
+        Returns:
+            int: The anomaly bitmask, 0 when nothing deviates.
+        """
+        flag = 0
+        for bit, slider in enumerate(TABLE_SLIDER_COLUMNS[table_name]):
+            stats = self.stats.get(slider)
+            if stats is None or stats[2] < tkc.ANOMALY_WARMUP_SAMPLES:
+                continue
+            mean, variance, _ = stats
+            std = max(math.sqrt(variance), MIN_STD)
+            if abs(values[slider] - mean) / std > tkc.ANOMALY_Z_THRESHOLD:
+                flag |= 1 << bit
+        return flag
+
+    def update(self, table_name: str, values: Dict[str, int]) -> None:
+        """
+        Folds a committed row into the running statistics and stores them.
+
+        Args:
+            table_name (str): One of FLAGGED_TABLES.
+            values (Dict[str, int]): The row's slider values by column name.
+
+        Returns:
+            None
+        """
+        alpha = tkc.ANOMALY_EWMA_ALPHA
+        query = QSqlQuery(QSqlDatabase.database())
+        query.prepare("""INSERT INTO slider_stats_table(slider, mean, variance, samples)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT(slider) DO UPDATE SET
+                            mean = excluded.mean,
+                            variance = excluded.variance,
+                            samples = excluded.samples""")
+        for slider in TABLE_SLIDER_COLUMNS[table_name]:
+            value = values[slider]
+            stats = self.stats.get(slider)
+            if stats is None:
+                stats = self.stats[slider] = [float(value), 0.0, 1]
+            else:
+                deviation = value - stats[0]
+                stats[0] += alpha * deviation
+                stats[1] = (1 - alpha) * (stats[1] + alpha * deviation * deviation)
+                stats[2] += 1
+            query.addBindValue(slider)
+            query.addBindValue(stats[0])
+            query.addBindValue(stats[1])
+            query.addBindValue(stats[2])
+            if not query_log.exec(query):
+                logger.error(f"Error storing statistics of {slider}: {query.lastError().text()}")
@@ -0,0 +1,248 @@
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery, QSqlTableModel
+from logger_setup import logger
+from database.database_utility.query_log import query_log
+from analytics.result_cache import result_cache
+from database.database_utility.table_columns import TABLE_DATE_COLUMNS
+
+# forecasting.py
+
+# Daily series that get a forecast: name -> (table, slider column)
+FORECAST_SERIES = {
+    "mood": ("mental_mental_table", "mood_slider"),
+    "depression": ("mental_mental_table", "depression_slider"),
+    "pain": ("cspr_table", "pain_slider"),
+    "stress": ("cspr_table", "stress_slider"),
+    "wellbeing": ("wefe_table", "wellbeing_slider"),
+}
+
+MAX_HORIZON = 7
+SLIDER_MIN, SLIDER_MAX = 0.0, 10.0
+
+# Holt's linear smoothing parameters tried when a series is fitted
+ALPHA_GRID = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+BETA_GRID = (0.0, 0.05, 0.1, 0.2, 0.3)
+PARAMETER_GRID = [(alpha, beta) for alpha in ALPHA_GRID for beta in BETA_GRID]
+
+
+class SeriesState:
+    """
+    Fitted Holt (double exponential smoothing) state of one daily series.
+
+    level and trend cover every closed day. The most recent day stays open, as more
+    entries for it can still be committed, and is kept as a running sum and count.
+    """
+
+    def __init__(self, alpha: float, beta: float, level: float, trend: float,
+                 open_day: str, open_sum: float, open_count: int, last_id: int) -> None:
+        self.alpha = alpha
+        self.beta = beta
+        self.level = level
+        self.trend = trend
+        self.open_day = open_day
+        self.open_sum = open_sum
+        self.open_count = open_count
+        self.last_id = last_id
+
+    def close_open_day(self) -> None:
+        """Folds the open day's mean into level and trend."""
+        value = self.open_sum / self.open_count
+        previous_level = self.level
+        self.level = self.alpha * value + (1 - self.alpha) * (self.level + self.trend)
+        self.trend = self.beta * (self.level - previous_level) + (1 - self.beta) * self.trend
+
+    def predict(self, days: int) -> List[float]:
+        """Projects the series days ahead of the open day, clipped to the slider range."""
+        value = self.open_sum / self.open_count
+        level = self.alpha * value + (1 - self.alpha) * (self.level + self.trend)
+        trend = self.beta * (level - self.level) + (1 - self.beta) * self.trend
+        return [min(SLIDER_MAX, max(SLIDER_MIN, level + step * trend))
+                for step in range(1, days + 1)]
+
+
+def load_daily_series(table_name: str, slider: str,
+                      after_id: int = 0) -> Tuple[List[Tuple[str, float, int]], int]:
+    """
+    Aggregates a slider to one (day, sum, count) entry per day, oldest day first.
+
+    Args:
+        table_name (str): The tracker table to read.
+        slider (str): The slider column to aggregate.
+        after_id (int): Only rows with a larger id are read.
+
+    Returns:
+        Tuple[List[Tuple[str, float, int]], int]: The daily entries and the largest id read.
+    """
+    date_column = TABLE_DATE_COLUMNS[table_name]
+    days: List[Tuple[str, float, int]] = []
+    newest_id = after_id
+    query = QSqlQuery(QSqlDatabase.database())
+    query.prepare(f"""SELECT {date_column}, SUM({slider}), COUNT({slider}), MAX(id)
+                    FROM {table_name}
+                    WHERE id > ? AND {slider} IS NOT NULL
+                    GROUP BY {date_column}
+                    ORDER BY {date_column}""")
+    query.addBindValue(after_id)
+    if not query_log.exec(query):
+        logger.error(f"Error loading daily series {table_name}.{slider}: {query.lastError().text()}")
+        return days, newest_id
+    while query.next():
+        days.append((query.value(0), float(query.value(1)), int(query.value(2))))
+        newest_id = max(newest_id, int(query.value(3)))
+    return days, newest_id
+
+
+def fit_series(days: List[Tuple[str, float, int]], last_id: int) -> Optional[SeriesState]:
+    """
+    Fits Holt's linear smoothing to a daily series by one-step-ahead squared error.
+
+    Every (alpha, beta) pair of PARAMETER_GRID is advanced together through a single
+    pass over the closed days, so the grid search costs one loop over the data.
+
+    Args:
+        days (List[Tuple[str, float, int]]): Daily (day, sum, count) entries, oldest first.
+        last_id (int): The largest row id included in days.
+
+    Returns:
+        Optional[SeriesState]: The fitted state, or None for an empty series.
+    """
+    if not days:
+        return None
+    open_day, open_sum, open_count = days[-1]
+    closed = [day_sum / count for _, day_sum, count in days[:-1]]
+    if not closed:
+        alpha, beta = PARAMETER_GRID[len(PARAMETER_GRID) // 2]
+        return SeriesState(alpha, beta, open_sum / open_count, 0.0,
+                           open_day, open_sum, open_count, last_id)
+
+    alphas = [alpha for alpha, _ in PARAMETER_GRID]
+    betas = [beta for _, beta in PARAMETER_GRID]
+    levels = [closed[0]] * len(PARAMETER_GRID)
+    trends = [0.0] * len(PARAMETER_GRID)
+    errors = [0.0] * len(PARAMETER_GRID)
+    for value in closed[1:]:
+        forecasts = [level + trend for level, trend in zip(levels, trends)]
+        errors = [error + (value - forecast) ** 2 for error, forecast in zip(errors, forecasts)]
+        new_levels = [a * value + (1 - a) * forecast for a, forecast in zip(alphas, forecasts)]
+        trends = [b * (new - old) + (1 - b) * trend
+                  for b, new, old, trend in zip(betas, new_levels, levels, trends)]
+        levels = new_levels
+
+    best = min(range(len(PARAMETER_GRID)), key=errors.__getitem__)
+    return SeriesState(alphas[best], betas[best], levels[best], trends[best],
+                       open_day, open_sum, open_count, last_id)
+
+
+class Forecaster:
+    """
+    Short-term forecasts of the FORECAST_SERIES, with fitted parameters cached.
+
+    A series is fitted the first time it is forecast. After that, committed rows are
+    folded into the cached state by update(), which reads only rows past the last
+    one seen, so opening a forecast panel again doesn't refit anything.
+    """
+
+    def __init__(self) -> None:
+        self.states: Dict[str, SeriesState] = {}
+        self.stale_tables = set()
+
+    def fit(self, name: str) -> None:
+        """Fits a series from scratch and caches its state."""
+        table_name, slider = FORECAST_SERIES[name]
+        days, last_id = load_daily_series(table_name, slider)
+        state = fit_series(days, last_id)
+        if state is None:
+            self.states.pop(name, None)
+        else:
+            self.states[name] = state
+
+    def update(self, table_name: str) -> None:
+        """
+        Folds rows committed to table_name into the cached states of its series.
+
+        Series that were never fitted are left alone. A row dated before a series'
+        open day can't be folded in incrementally and makes that series refit.
+
+        Args:
+            table_name (str): The table that was just written to.
+
+        Returns:
+            None
+        """
+        for name, (series_table, slider) in FORECAST_SERIES.items():
+            state = self.states.get(name)
+            if series_table != table_name or state is None:
+                continue
+            try:
+                days, newest_id = load_daily_series(table_name, slider, state.last_id)
+                if any(day < state.open_day for day, _, _ in days):
+                    self.fit(name)
+                    continue
+                for day, day_sum, count in days:
+                    if day != state.open_day:
+                        state.close_open_day()
+                        state.open_day, state.open_sum, state.open_count = day, 0.0, 0
+                    state.open_sum += day_sum
+                    state.open_count += count
+                state.last_id = newest_id
+            except Exception as e:
+                logger.error(f"Error updating forecast {name}: {e}", exc_info=True)
+                self.states.pop(name, None)
+
+    def invalidate(self, table_name: str) -> None:
+        """Marks the series of table_name for a refit, e.g. after rows were edited or deleted."""
+        self.stale_tables.add(table_name)
+
+    def forecast(self, days: int = MAX_HORIZON) -> Dict[str, List[float]]:
+        """
+        Predicts every series for the next days after its most recent entry.
+
+        Args:
+            days (int): Forecast horizon, between 1 and MAX_HORIZON.
+
+        Returns:
+            Dict[str, List[float]]: The predicted daily means per series name.
+            Series without any data are left out.
+
+        Raises:
+            ValueError: If days is outside 1..MAX_HORIZON.
+        """
+        if not 1 <= days <= MAX_HORIZON:
+            raise ValueError(f"Forecast horizon must be between 1 and {MAX_HORIZON}, got {days}")
+        tables = {table_name for table_name, _ in FORECAST_SERIES.values()}
+        return result_cache.get_or_compute("forecast", (days,), tables,
+                                           lambda: self.predict_all(days))
+
+    def predict_all(self, days: int) -> Dict[str, List[float]]:
+        """Predicts every series, fitting the ones that have no valid cached state."""
+        predictions: Dict[str, List[float]] = {}
+        for name, (table_name, _) in FORECAST_SERIES.items():
+            try:
+                if name not in self.states or table_name in self.stale_tables:
+                    self.fit(name)
+                if name in self.states:
+                    predictions[name] = self.states[name].predict(days)
+            except Exception as e:
+                logger.error(f"Error forecasting {name}: {e}", exc_info=True)
+        self.stale_tables.clear()
+        return predictions
+
+
+forecaster = Forecaster()
+
+
+def invalidate_forecasts_on_edit(model: QSqlTableModel) -> None:
+    """
+    Marks the series of the model's table for a refit whenever a row is edited or
+    deleted through the model.
+
+    Args:
+        model (QSqlTableModel): A model over one of the tracker tables.
+
+    Returns:
+        None
+    """
+    table_name = model.tableName()
+    if any(series_table == table_name for series_table, _ in FORECAST_SERIES.values()):
+        model.beforeUpdate.connect(lambda *_: forecaster.invalidate(table_name))
+        model.beforeDelete.connect(lambda *_: forecaster.invalidate(table_name))
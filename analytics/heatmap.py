@@ -0,0 +1,213 @@
+from typing import List, Set, Tuple
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery, QSqlTableModel
+from logger_setup import logger
+from database.database_utility.query_log import query_log
+from analytics.result_cache import result_cache
+from database.database_utility.table_columns import (
+    TABLE_DATE_COLUMNS, TABLE_TIME_COLUMNS, TABLE_SLIDER_COLUMNS)
+
+# heatmap.py
+
+HOURS_PER_DAY = 24
+DAYS_PER_WEEK = 7  # weekday 0 is Sunday, as in SQLite's strftime('%w')
+reset_tables: Set[str] = set()  # tables reset since their grid was last read
+
+
+def setup_heatmap_tables(query: QSqlQuery) -> None:
+    """
+    Creates the hour-of-day x weekday aggregate tables if they don't already exist.
+
+    heatmap_table keeps one (entry_count, value_sum) cell per source table, slider,
+    weekday and hour. heatmap_state_table remembers the last row id of each source
+    table that has been folded into the grid, so refreshing only touches new rows.
+
+    Args:
+        query (QSqlQuery): The query used by the DataManager.
+
+    Returns:
+        None
+    """
+    if not query_log.exec(query, """
+                        CREATE TABLE IF NOT EXISTS heatmap_table (
+                        source_table TEXT NOT NULL,
+                        slider TEXT NOT NULL,
+                        weekday INTEGER NOT NULL,
+                        hour INTEGER NOT NULL,
+                        entry_count INTEGER NOT NULL DEFAULT 0,
+                        value_sum INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (source_table, slider, weekday, hour)
+                        ) WITHOUT ROWID"""):
+        logger.error(f"Error creating table: heatmap_table {query.lastError().text()}")
+    if not query_log.exec(query, """
+                        CREATE TABLE IF NOT EXISTS heatmap_state_table (
+                        source_table TEXT PRIMARY KEY,
+                        last_id INTEGER NOT NULL DEFAULT 0
+                        )"""):
+        logger.error(f"Error creating table: heatmap_state_table {query.lastError().text()}")
+
+
+def refresh_heatmap(table_name: str, rebuild: bool = False) -> None:
+    """
+    Folds the rows of table_name that are not yet aggregated into heatmap_table.
+
+    The TEXT date and time columns are parsed once per row, inside SQLite, when the
+    row is folded in. Called after every insert, so normally only the new row is read.
+    A table without a heatmap_state_table row was reset, or never aggregated, and is
+    only rebuilt from all of its rows when rebuild is set, i.e. when a grid is read.
+
+    Args:
+        table_name (str): One of the tracker tables in TABLE_SLIDER_COLUMNS.
+        rebuild (bool): Whether to aggregate a reset table from scratch.
+
+    Returns:
+        None
+    """
+    db = QSqlDatabase.database()
+    query = QSqlQuery(db)
+    date_column = TABLE_DATE_COLUMNS[table_name]
+    time_column = TABLE_TIME_COLUMNS[table_name]
+    try:
+        db.transaction()
+        query.prepare("SELECT last_id FROM heatmap_state_table WHERE source_table = ?")
+        query.addBindValue(table_name)
+        query_log.exec(query)
+        last_id = query.value(0) if query.next() else None
+        if last_id is None:
+            if not rebuild:
+                db.rollback()
+                return
+            last_id = 0
+
+        query_log.exec(query, f"SELECT COALESCE(MAX(id), 0) FROM {table_name}")
+        newest_id = query.value(0) if query.next() else 0
+        if newest_id <= last_id:
+            db.rollback()
+            return
+
+        for slider in TABLE_SLIDER_COLUMNS[table_name]:
+            query.prepare(f"""
+                        INSERT INTO heatmap_table(source_table, slider, weekday, hour,
+                                                  entry_count, value_sum)
+                        SELECT ?, ?, weekday, hour, COUNT({slider}), COALESCE(SUM({slider}), 0)
+                        FROM (SELECT CAST(strftime('%w', {date_column}) AS INTEGER) AS weekday,
+                                     CAST(substr({time_column}, 1, 2) AS INTEGER) AS hour,
+                                     {slider}
+                              FROM {table_name}
+                              WHERE id > ? AND id <= ?)
+                        WHERE weekday IS NOT NULL AND hour BETWEEN 0 AND 23
+                        GROUP BY weekday, hour
+                        ON CONFLICT(source_table, slider, weekday, hour) DO UPDATE SET
+                            entry_count = entry_count + excluded.entry_count,
+                            value_sum = value_sum + excluded.value_sum""")
+            for value in (table_name, slider, last_id, newest_id):
+                query.addBindValue(value)
+            if not query_log.exec(query):
+                raise RuntimeError(query.lastError().text())
+
+        query.prepare("""INSERT INTO heatmap_state_table(source_table, last_id) VALUES (?, ?)
+                        ON CONFLICT(source_table) DO UPDATE SET last_id = excluded.last_id""")
+        query.addBindValue(table_name)
+        query.addBindValue(newest_id)
+        if not query_log.exec(query):
+            raise RuntimeError(query.lastError().text())
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error refreshing heatmap for {table_name}: {e}", exc_info=True)
+
+
+def reset_heatmap(table_name: str) -> None:
+    """
+    Drops the aggregates of table_name so the next grid read rebuilds them.
+
+    Rows that are edited or deleted can't be subtracted from the grid reliably,
+    so those changes throw away the table's cells instead. A table is reset once,
+    however many rows a deletion or edit session touches, and stays reset until one
+    of its grids is read again.
+
+    Args:
+        table_name (str): One of the tracker tables in TABLE_SLIDER_COLUMNS.
+
+    Returns:
+        None
+    """
+    if table_name in reset_tables:
+        return
+    reset_tables.add(table_name)
+    query = QSqlQuery(QSqlDatabase.database())
+    try:
+        for sql in ("DELETE FROM heatmap_table WHERE source_table = ?",
+                    "DELETE FROM heatmap_state_table WHERE source_table = ?"):
+            query.prepare(sql)
+            query.addBindValue(table_name)
+            if not query_log.exec(query):
+                logger.error(f"Error resetting heatmap for {table_name}: {query.lastError().text()}")
+    except Exception as e:
+        logger.error(f"Error resetting heatmap for {table_name}: {e}", exc_info=True)
+
+
+def load_heatmap_grid(table_name: str, slider: str) -> List[List[Tuple[int, int]]]:
+    """
+    Returns the 24x7 grid of (entry_count, value_sum) cells for one slider.
+
+    The grid is indexed as grid[hour][weekday] and is served from the result cache
+    until table_name changes.
+
+    Args:
+        table_name (str): One of the tracker tables in TABLE_SLIDER_COLUMNS.
+        slider (str): A slider column of that table.
+
+    Returns:
+        List[List[Tuple[int, int]]]: The aggregate grid.
+    """
+    return result_cache.get_or_compute("heatmap", (table_name, slider), (table_name,),
+                                       lambda: read_heatmap_grid(table_name, slider))
+
+
+def read_heatmap_grid(table_name: str, slider: str) -> List[List[Tuple[int, int]]]:
+    """
+    Refreshes and reads the 24x7 grid of one slider from heatmap_table.
+
+    Reading it is a single indexed scan of at most 168 rows, whatever the size of
+    the source table. Only the first read after a reset rebuilds the table's cells.
+
+    Args:
+        table_name (str): One of the tracker tables in TABLE_SLIDER_COLUMNS.
+        slider (str): A slider column of that table.
+
+    Returns:
+        List[List[Tuple[int, int]]]: The aggregate grid.
+    """
+    grid = [[(0, 0)] * DAYS_PER_WEEK for _ in range(HOURS_PER_DAY)]
+    reset_tables.discard(table_name)
+    refresh_heatmap(table_name, rebuild=True)
+    query = QSqlQuery(QSqlDatabase.database())
+    try:
+        query.prepare("""SELECT weekday, hour, entry_count, value_sum FROM heatmap_table
+                        WHERE source_table = ? AND slider = ?""")
+        query.addBindValue(table_name)
+        query.addBindValue(slider)
+        if not query_log.exec(query):
+            logger.error(f"Error loading heatmap for {table_name}.{slider}: {query.lastError().text()}")
+        while query.next():
+            grid[query.value(1)][query.value(0)] = (query.value(2), query.value(3))
+    except Exception as e:
+        logger.error(f"Error loading heatmap for {table_name}.{slider}: {e}", exc_info=True)
+    return grid
+
+
+def invalidate_heatmap_on_edit(model: QSqlTableModel) -> None:
+    """
+    Resets the heatmap of the model's table when rows are edited or deleted through
+    the model. Only the first row of a batch actually resets it.
+
+    Args:
+        model (QSqlTableModel): A model over one of the tracker tables.
+
+    Returns:
+        None
+    """
+    table_name = model.tableName()
+    if table_name in TABLE_SLIDER_COLUMNS:
+        model.beforeUpdate.connect(lambda *_: reset_heatmap(table_name))
+        model.beforeDelete.connect(lambda *_: reset_heatmap(table_name))
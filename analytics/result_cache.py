@@ -0,0 +1,169 @@
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Tuple
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+import tracker_config as tkc
+from logger_setup import logger
+from database.database_utility.query_log import query_log
+from database.database_utility.table_columns import TABLE_SLIDER_COLUMNS
+
+# result_cache.py
+
+
+def setup_change_log(query: QSqlQuery) -> None:
+    """
+    Creates change_log_table and the triggers that bump a per-table sequence number
+    on every insert, update and delete of a tracker table.
+
+    The triggers also fire for writes made through the QSqlTableModels, which never
+    go through the DataManager.
+
+    Args:
+        query (QSqlQuery): The query used by the DataManager.
+
+    Returns:
+        None
+    """
+    if not query_log.exec(query, """
+                        CREATE TABLE IF NOT EXISTS change_log_table (
+                        source_table TEXT PRIMARY KEY,
+                        seq INTEGER NOT NULL DEFAULT 0
+                        ) WITHOUT ROWID"""):
+        logger.error(f"Error creating table: change_log_table {query.lastError().text()}")
+    for table_name in TABLE_SLIDER_COLUMNS:
+        query_log.exec(query, f"INSERT OR IGNORE INTO change_log_table(source_table, seq) VALUES ('{table_name}', 0)")
+        for operation in ("INSERT", "UPDATE", "DELETE"):
+            if not query_log.exec(query, f"""
+                        CREATE TRIGGER IF NOT EXISTS {table_name}_{operation.lower()}_log
+                        AFTER {operation} ON {table_name}
+                        BEGIN
+                            UPDATE change_log_table SET seq = seq + 1
+                            WHERE source_table = '{table_name}';
+                        END"""):
+                logger.error(f"Error creating change log trigger on {table_name}: "
+                             f"{query.lastError().text()}")
+
+
+def data_version(tables: Iterable[str]) -> Tuple[int, ...]:
+    """
+    Returns a cheap token that changes whenever any of the given tables changes.
+
+    The token combines PRAGMA data_version, which moves when another connection
+    commits, with the change-log sequence numbers of the tables, which move on
+    every write made through this connection.
+
+    Args:
+        tables (Iterable[str]): The tracker tables a result depends on.
+
+    Returns:
+        Tuple[int, ...]: The version token.
+    """
+    tables = sorted(tables)
+    query = QSqlQuery(QSqlDatabase.database())
+    version = []
+    if query_log.exec(query, "PRAGMA data_version") and query.next():
+        version.append(query.value(0))
+    query.prepare(f"""SELECT seq FROM change_log_table
+                    WHERE source_table IN ({', '.join('?' * len(tables))})
+                    ORDER BY source_table""")
+    for table_name in tables:
+        query.addBindValue(table_name)
+    if query_log.exec(query):
+        while query.next():
+            version.append(query.value(0))
+    return tuple(version)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimates the memory held by a result made of containers and scalars.
+
+    Args:
+        value (Any): The result to measure.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class ResultCache:
+    """
+    LRU cache of analytic results, bounded by an estimated memory budget.
+
+    Entries are keyed on the analytic's name and parameters and remember the data
+    version they were computed at. A lookup whose version no longer matches
+    recomputes the result, so entries are reused until one of their tables
+    changes and never served after that. Cached results are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries: "OrderedDict[Hashable, Tuple[Tuple[int, ...], Any, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, name: str, params: Tuple, tables: Iterable[str],
+                       compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached result for name and params, computing it when missing or stale.
+
+        Args:
+            name (str): The analytic's name.
+            params (Tuple): Hashable parameters of the call.
+            tables (Iterable[str]): The tracker tables the result is computed from.
+            compute (Callable[[], Any]): Computes the result.
+
+        Returns:
+            Any: The result.
+        """
+        key = (name, params)
+        try:
+            version = data_version(tables)
+        except Exception as e:
+            logger.error(f"Error reading data version for {name}: {e}", exc_info=True)
+            return compute()
+
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        result = compute()
+        self.store(key, version, result)
+        return result
+
+    def store(self, key: Hashable, version: Tuple[int, ...], result: Any) -> None:
+        """Stores a result, evicting least recently used entries beyond the budget."""
+        self.discard(key)
+        size = estimate_size(result)
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (version, result, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def discard(self, key: Hashable) -> None:
+        """Drops a single entry if present."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        self.entries.clear()
+        self.total_bytes = 0
+
+
+result_cache = ResultCache(tkc.RESULT_CACHE_MAX_BYTES)
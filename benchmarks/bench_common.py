@@ -0,0 +1,178 @@
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+import tracker_config as tkc
+
+# bench_common.py
+# Helpers shared by the benchmark scripts: isolated child processes, benchmark
+# databases and the JSON result history.
+
+RESULTS_DIRECTORY = os.path.join(ROOT, 'benchmarks', 'results')
+
+SCHEMA_PROBE = """
+from PyQt6.QtCore import QCoreApplication
+app = QCoreApplication([])
+from database.database_manager import DataManager
+DataManager()
+print("{}")
+"""
+
+
+def child_env(home: str) -> Dict[str, str]:
+    """
+    Returns the environment of a benchmark child process.
+
+    HOME points at a temporary directory, so the database, the log file and the
+    QSettings of the child never touch the user's own, and Qt runs offscreen.
+
+    Args:
+        home (str): The child's home directory.
+
+    Returns:
+        Dict[str, str]: The environment.
+    """
+    return dict(os.environ, PYTHONPATH=ROOT, HOME=home, QT_QPA_PLATFORM="offscreen",
+                XDG_CONFIG_HOME=os.path.join(home, '.config'))
+
+
+def run_python(code: str, home: str, args: Optional[List[str]] = None,
+               timeout: float = 600) -> dict:
+    """
+    Runs code in a fresh interpreter and returns the JSON object it prints last.
+
+    Args:
+        code (str): The program, which must print one JSON object as its last line.
+        home (str): The child's home directory.
+        args (List[str]): Extra command line arguments for the program.
+        timeout (float): Seconds before the child is killed.
+
+    Returns:
+        dict: The decoded last line of the child's stdout.
+
+    Raises:
+        RuntimeError: If the child fails or prints no JSON.
+    """
+    result = subprocess.run([sys.executable, "-c", code] + (args or []), cwd=ROOT,
+                            env=child_env(home), capture_output=True, text=True,
+                            timeout=timeout)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(f"benchmark child failed ({result.returncode}): {result.stderr[-2000:]}")
+    return json.loads(lines[-1])
+
+
+def database_path(home: str) -> str:
+    """Returns where the app keeps its database when HOME is home."""
+    return os.path.join(home, tkc.DB_NAME)
+
+
+def create_schema(home: str) -> str:
+    """
+    Creates the app's database in home by running the DataManager once.
+
+    Args:
+        home (str): The home directory of the benchmark children.
+
+    Returns:
+        str: The database path.
+    """
+    run_python(SCHEMA_PROBE, home)
+    return database_path(home)
+
+
+def summarize_samples(samples: List[float]) -> Dict[str, float]:
+    """
+    Reduces the samples of one metric to the shape every benchmark record uses.
+
+    Args:
+        samples (List[float]): The measurements.
+
+    Returns:
+        Dict[str, float]: The median, min and max, rounded to 3 decimals.
+    """
+    return {"median": round(statistics.median(samples), 3),
+            "min": round(min(samples), 3),
+            "max": round(max(samples), 3)}
+
+
+def git_revision() -> Optional[str]:
+    """Returns the commit the benchmarks run against, or None outside a git checkout."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except Exception:
+        return None
+
+
+def environment_info() -> dict:
+    """Describes the machine and interpreter, so results are only compared like for like."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def stamp_record(record: dict) -> dict:
+    """Returns record stamped with the time, the git revision and the environment it was taken in."""
+    return dict({
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "environment": environment_info(),
+    }, **record)
+
+
+def write_json(path: str, data) -> None:
+    """Writes data as indented JSON with sorted keys, so files diff cleanly between runs."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+
+def load_record(path: str) -> dict:
+    """
+    Reads a benchmark record, or the newest record of a history file.
+
+    Args:
+        path (str): A file written by write_json or append_history.
+
+    Returns:
+        dict: The record.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    return data[-1] if isinstance(data, list) else data
+
+
+def append_history(history_file: str, record: dict) -> dict:
+    """
+    Appends a benchmark record to a JSON history file.
+
+    The file holds a list of records, oldest first, each stamped by stamp_record.
+
+    Args:
+        history_file (str): Path to the history file, created if missing.
+        record (dict): The results of one benchmark invocation.
+
+    Returns:
+        dict: The stamped record.
+    """
+    history = []
+    if os.path.exists(history_file):
+        with open(history_file, 'r', encoding='utf-8') as file:
+            history = json.load(file)
+    stamped = stamp_record(record)
+    history.append(stamped)
+    write_json(history_file, history)
+    return stamped
@@ -0,0 +1,118 @@
+import argparse
+import os
+import sys
+import tempfile
+from typing import List
+
+from bench_common import (
+    RESULTS_DIRECTORY, append_history, create_schema, run_python,
+    summarize_samples)
+from synthetic_data import fill_database
+
+# cold_start.py
+# Launches MainWindow in fresh offscreen interpreters against databases of
+# different sizes and appends the timings to a JSON history.
+#
+#   python benchmarks/cold_start.py [--rows 0 10000 1000000] [--runs 5] [--page 0]
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import PyQt6.QtCore, PyQt6.QtGui, PyQt6.QtWidgets, PyQt6.QtSql
+qt_imported = time.perf_counter()
+from ui.main_window import MainWindow
+app_imported = time.perf_counter()
+from PyQt6.QtCore import QSettings
+from PyQt6.QtWidgets import QApplication
+import tracker_config as tkc
+from utility.app_operations.resource_loader import register_resources
+from utility.app_operations.stylesheet_loader import apply_stylesheet
+app = QApplication(sys.argv[:1])
+QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME).setValue("lastPageIndex", int(sys.argv[1]))
+register_resources()
+apply_stylesheet(app)
+window_start = time.perf_counter()
+window = MainWindow()
+window_built = time.perf_counter()
+window.show()
+app.processEvents()
+shown = time.perf_counter()
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "import_qt_ms": (qt_imported - start) * 1000,
+    "import_app_ms": (app_imported - qt_imported) * 1000,
+    "main_window_ms": (window_built - window_start) * 1000,
+    "show_ms": (shown - start) * 1000,
+    "peak_rss_mb": peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+}))
+"""
+
+METRICS = ("import_qt_ms", "import_app_ms", "main_window_ms", "show_ms", "peak_rss_mb")
+
+
+def summarize(runs: List[dict]) -> dict:
+    """
+    Reduces the runs of one database size to the median and spread of each metric.
+
+    Args:
+        runs (List[dict]): The probe results.
+
+    Returns:
+        dict: metric -> {"median", "min", "max"}.
+    """
+    return {metric: summarize_samples([run[metric] for run in runs]) for metric in METRICS}
+
+
+def benchmark_size(rows: int, runs: int, page: int) -> dict:
+    """
+    Measures cold starts against a database with rows entries per table.
+
+    The first launch is a warm-up that is not recorded: it runs the schema
+    migrations a fresh copy of the database needs, like a user's first launch
+    after an upgrade.
+
+    Args:
+        rows (int): Rows per tracker table.
+        runs (int): Recorded launches.
+        page (int): The mainStack page restored at startup.
+
+    Returns:
+        dict: The summary of the recorded launches.
+    """
+    with tempfile.TemporaryDirectory() as home:
+        fill_database(create_schema(home), rows)
+        run_python(PROBE, home, [str(page)])
+        results = [run_python(PROBE, home, [str(page)]) for _ in range(runs)]
+    return summarize(results)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Headless cold-start benchmark of MainWindow.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[0, 10_000, 1_000_000],
+                        help="rows per table of each benchmark database")
+    parser.add_argument("--runs", type=int, default=5, help="recorded launches per database")
+    parser.add_argument("--page", type=int, default=0, help="mainStack page restored at startup")
+    parser.add_argument("--history", default=os.path.join(RESULTS_DIRECTORY, "cold_start.json"),
+                        help="JSON history the results are appended to")
+    options = parser.parse_args(argv)
+
+    sizes = {}
+    for rows in options.rows:
+        sizes[str(rows)] = summary = benchmark_size(rows, options.runs, options.page)
+        print(f"{rows:>9} rows: show {summary['show_ms']['median']:8.1f} ms  "
+              f"MainWindow {summary['main_window_ms']['median']:8.1f} ms  "
+              f"imports {summary['import_qt_ms']['median'] + summary['import_app_ms']['median']:7.1f} ms  "
+              f"peak RSS {summary['peak_rss_mb']['median']:7.1f} MB")
+
+    append_history(options.history, {
+        "benchmark": "cold_start",
+        "runs": options.runs,
+        "page": options.page,
+        "sizes": sizes,
+    })
+    print(f"appended to {options.history}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
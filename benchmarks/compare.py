@@ -0,0 +1,94 @@
+import argparse
+import os
+import sys
+from typing import List, Tuple
+
+from bench_common import RESULTS_DIRECTORY, load_record
+
+# compare.py
+# Compares a benchmark record against a stored baseline and fails on regressions.
+# Works on any record with the sizes -> metric -> {"median", ...} layout, i.e. the
+# output of db_layer.py, cold_start.py and window_resize.py. History files compare
+# their newest record. Records with metric_units show each metric's unit.
+#
+#   python benchmarks/compare.py [current] [--baseline FILE] [--threshold 0.15]
+
+
+def metric_unit(record: dict, metric: str) -> str:
+    """Returns the unit of a metric from the record's metric_units, keyed by the name's first component."""
+    unit = record.get("metric_units", {}).get(metric.split(".")[0])
+    return f"  {unit}" if unit else ""
+
+
+def compare(baseline: dict, current: dict, threshold: float,
+            min_delta: float) -> Tuple[List[str], List[str]]:
+    """
+    Compares the medians of every metric the two records share.
+
+    A metric regresses when its median grew by more than threshold, relative to the
+    baseline, and by at least min_delta in absolute terms, which keeps sub-noise
+    changes of very fast operations from being flagged.
+
+    Args:
+        baseline (dict): The reference record.
+        current (dict): The record to check.
+        threshold (float): Allowed relative slowdown, e.g. 0.15 for 15%.
+        min_delta (float): Smallest absolute change that can count as a regression.
+
+    Returns:
+        Tuple[List[str], List[str]]: The report lines, and the regressed metrics.
+    """
+    lines, regressions = [], []
+    label = current.get("size_label", "rows")
+    for size, metrics in sorted(current["sizes"].items(), key=lambda item: int(item[0])):
+        reference = baseline["sizes"].get(size)
+        if reference is None:
+            lines.append(f"{size:>9} {label}: not in the baseline")
+            continue
+        lines.append(f"{size:>9} {label}")
+        for metric, values in sorted(metrics.items()):
+            if metric not in reference:
+                lines.append(f"    {metric:<42} {values['median']:10.3f}   (new){metric_unit(current, metric)}")
+                continue
+            before, after = reference[metric]["median"], values["median"]
+            change = (after - before) / before if before else 0.0
+            regressed = change > threshold and after - before >= min_delta
+            if regressed:
+                regressions.append(f"{size}/{metric}")
+            lines.append(f"    {metric:<42} {before:10.3f} -> {after:10.3f}  {change:+7.1%}"
+                         f"{metric_unit(current, metric)}{'  REGRESSION' if regressed else ''}")
+    return lines, regressions
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Flags benchmark regressions against a baseline.")
+    parser.add_argument("current", nargs="?", default=os.path.join(RESULTS_DIRECTORY, "db_layer.json"),
+                        help="record or history file to check, its newest record is used")
+    parser.add_argument("--baseline", default=os.path.join(RESULTS_DIRECTORY, "db_layer_baseline.json"),
+                        help="record or history file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="allowed relative slowdown of a median")
+    parser.add_argument("--min-delta", type=float, default=0.25,
+                        help="smallest absolute slowdown that counts, in the metric's unit")
+    options = parser.parse_args(argv)
+
+    baseline, current = load_record(options.baseline), load_record(options.current)
+    if baseline.get("benchmark") != current.get("benchmark"):
+        print(f"cannot compare {current.get('benchmark')} against a {baseline.get('benchmark')} baseline")
+        return 2
+    print(f"baseline {baseline.get('revision')} ({baseline.get('timestamp')}), "
+          f"current {current.get('revision')} ({current.get('timestamp')})")
+    if baseline.get("environment") != current.get("environment"):
+        print("warning: the records were taken in different environments")
+
+    lines, regressions = compare(baseline, current, options.threshold, options.min_delta)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {options.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,196 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from bench_common import (
+    RESULTS_DIRECTORY, append_history, create_schema, run_python,
+    summarize_samples, write_json)
+from synthetic_data import fill_database
+
+# db_layer.py
+# Times the database and model layer headless, in a fresh interpreter per database
+# size: inserts, model setup and scrolling, deletes and the analytics queries.
+# Results are appended to a JSON history; compare.py checks them against a baseline.
+#
+#   python benchmarks/db_layer.py [--rows 10000 100000 1000000] [--repeats 3] [--save-baseline]
+
+PROBE = """
+import json, sys
+sys.path.insert(0, "benchmarks")
+from db_layer import probe
+print(json.dumps(probe(*map(int, sys.argv[1:]))))
+"""
+
+INSERTS_PER_REPEAT = 20  # single inserts through DataManager, per table and repeat
+BULK_ROWS = 1000  # rows of one bulk insert transaction
+FETCH_BATCHES = 20  # fetchMore calls timed per table and repeat, as when scrolling
+DELETE_ROWS = 50  # rows selected and deleted per table and repeat
+
+
+def time_ms(function: Callable[[], object]) -> float:
+    """Returns how long function takes, in milliseconds."""
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def probe(repeats: int) -> Dict[str, List[float]]:
+    """
+    Runs every measurement in this process, against the database in HOME.
+
+    Called in the benchmark child. Metrics are named '<area>.<operation>.<table>'
+    and hold one sample per timed call; inserts and deletes are per row.
+
+    Args:
+        repeats (int): How often each measurement is repeated.
+
+    Returns:
+        Dict[str, List[float]]: The samples of every metric, in milliseconds.
+    """
+    import datetime
+    from types import SimpleNamespace
+    from PyQt6.QtCore import QItemSelectionModel
+    from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+    from PyQt6.QtWidgets import QApplication, QTableView
+    app = QApplication(sys.argv[:1])
+    from database.database_manager import DataManager
+    from database.database_utility.delete_records import delete_selected_rows
+    from database.database_utility.model_setup import create_and_set_model
+    from database.database_utility.table_columns import (
+        TABLE_DATE_COLUMNS, TABLE_TIME_COLUMNS, TABLE_SLIDER_COLUMNS)
+    from analytics.heatmap import refresh_heatmap, reset_heatmap, read_heatmap_grid
+    from analytics.forecasting import forecaster, MAX_HORIZON
+
+    data_manager = DataManager()
+    db = QSqlDatabase.database()
+    samples: Dict[str, List[float]] = {}
+
+    def add(metric: str, value: float) -> None:
+        samples.setdefault(metric, []).append(value)
+
+    inserts = {
+        "mental_mental_table": lambda date, time_: data_manager.insert_into_mental_mental_table(
+            date, time_, 5, 5, 5, 5),
+        "cspr_table": lambda date, time_: data_manager.insert_into_cspr_exam(
+            date, time_, 5, 5, 5, 5),
+        "wefe_table": lambda date, time_: data_manager.insert_into_wefe_table(
+            date, time_, 5, 5, 5, 5, 20),
+    }
+
+    for table_name, sliders in TABLE_SLIDER_COLUMNS.items():
+        view = QTableView()
+        for _ in range(repeats):
+            add(f"model.create_and_set.{table_name}",
+                time_ms(lambda: create_and_set_model(table_name, view)))
+        model = view.model()
+        for _ in range(repeats):
+            add(f"model.select.{table_name}", time_ms(model.select))
+            for _ in range(FETCH_BATCHES):
+                if not model.canFetchMore():
+                    break
+                add(f"model.fetch_more.{table_name}", time_ms(model.fetchMore))
+
+        for _ in range(repeats):
+            reset_heatmap(table_name)
+            add(f"analytics.heatmap_fold.{table_name}", time_ms(lambda: refresh_heatmap(table_name, rebuild=True)))
+            add(f"analytics.heatmap_read.{table_name}",
+                time_ms(lambda: read_heatmap_grid(table_name, sliders[0])))
+
+        now = datetime.datetime.now()
+        date, time_ = now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S")
+        for _ in range(repeats):
+            for _ in range(INSERTS_PER_REPEAT):
+                add(f"insert.single.{table_name}", time_ms(lambda: inserts[table_name](date, time_)))
+
+        columns = [TABLE_DATE_COLUMNS[table_name], TABLE_TIME_COLUMNS[table_name]] + list(sliders)
+        query = QSqlQuery(db)
+        for _ in range(repeats):
+            def bulk_insert():
+                db.transaction()
+                query.prepare(f"INSERT INTO {table_name}({', '.join(columns)}) "
+                              f"VALUES ({', '.join('?' * len(columns))})")
+                query.addBindValue([date] * BULK_ROWS)
+                query.addBindValue([time_] * BULK_ROWS)
+                for _ in sliders:
+                    query.addBindValue([5] * BULK_ROWS)
+                if not query.execBatch():
+                    raise RuntimeError(query.lastError().text())
+                db.commit()
+            add(f"insert.bulk.{table_name}", time_ms(bulk_insert) / BULK_ROWS)
+
+        window = SimpleNamespace(view=view, model=model)
+        for _ in range(repeats):
+            model.select()
+            selection = view.selectionModel()
+            for row in range(min(DELETE_ROWS, model.rowCount())):
+                selection.select(model.index(row, 0), QItemSelectionModel.SelectionFlag.Select
+                                 | QItemSelectionModel.SelectionFlag.Rows)
+            selected = len(selection.selectedRows())
+            elapsed = time_ms(lambda: delete_selected_rows(window, "view", "model"))
+            if selected:
+                add(f"delete.selected_rows.{table_name}", elapsed / selected)
+
+    for _ in range(repeats):
+        forecaster.states.clear()
+        add("analytics.forecast_fit", time_ms(lambda: forecaster.predict_all(MAX_HORIZON)))
+        add("analytics.forecast_predict", time_ms(lambda: forecaster.predict_all(MAX_HORIZON)))
+    app.quit()
+    return samples
+
+
+def benchmark_size(rows: int, repeats: int) -> Dict[str, dict]:
+    """
+    Measures the database layer against a fresh database with rows entries per table.
+
+    Args:
+        rows (int): Rows per tracker table.
+        repeats (int): How often each measurement is repeated.
+
+    Returns:
+        Dict[str, dict]: metric -> {"median", "min", "max"}.
+    """
+    with tempfile.TemporaryDirectory() as home:
+        fill_database(create_schema(home), rows)
+        samples = run_python(PROBE, home, [str(repeats)], timeout=3600)
+    return {metric: summarize_samples(values) for metric, values in sorted(samples.items())}
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Headless benchmark of the database and model layer.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="rows per table of each benchmark database")
+    parser.add_argument("--repeats", type=int, default=3, help="repetitions of each measurement")
+    parser.add_argument("--history", default=os.path.join(RESULTS_DIRECTORY, "db_layer.json"),
+                        help="JSON history the results are appended to")
+    parser.add_argument("--save-baseline", nargs="?", metavar="FILE",
+                        const=os.path.join(RESULTS_DIRECTORY, "db_layer_baseline.json"),
+                        help="also store the results as the baseline compare.py checks against")
+    options = parser.parse_args(argv)
+
+    sizes = {}
+    for rows in options.rows:
+        sizes[str(rows)] = summary = benchmark_size(rows, options.repeats)
+        print(f"{rows:>9} rows")
+        for metric, values in summary.items():
+            print(f"    {metric:<42} {values['median']:10.3f} ms  "
+                  f"({values['min']:.3f} - {values['max']:.3f})")
+
+    record = {
+        "benchmark": "db_layer",
+        "repeats": options.repeats,
+        "unit": "milliseconds, per row for insert.* and delete.*",
+        "sizes": sizes,
+    }
+    stamped = append_history(options.history, record)
+    print(f"appended to {options.history}")
+    if options.save_baseline:
+        write_json(options.save_baseline, stamped)
+        print(f"saved baseline {options.save_baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,89 @@
+import argparse
+import statistics
+import sys
+import tempfile
+from typing import List
+
+from bench_common import run_python
+import tracker_config as tkc
+
+# import_budget.py
+# Cold-imports ui.main_window in fresh interpreters and fails if the median import
+# time exceeds tkc.IMPORT_BUDGET_MS or a deferred module got imported along with it.
+#
+#   python benchmarks/import_budget.py [module ...] [--runs N] [--budget MS]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"elapsed_ms": elapsed_ms, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(module: str, home: str) -> dict:
+    """
+    Imports module in a fresh interpreter and reports the time and the loaded modules.
+
+    Args:
+        module (str): The module to import.
+        home (str): HOME for the child, so the app's log directory lands in a temp dir.
+
+    Returns:
+        dict: elapsed_ms and the names in sys.modules after the import.
+    """
+    return run_python(PROBE.format(module=module), home)
+
+
+def check_module(module: str, runs: int, budget_ms: float) -> bool:
+    """
+    Runs the budget check for one module.
+
+    Args:
+        module (str): The module to import.
+        runs (int): Fresh interpreters to import it in.
+        budget_ms (float): The allowed median import time.
+
+    Returns:
+        bool: True when within budget and no deferred module was imported.
+    """
+    with tempfile.TemporaryDirectory() as home:
+        results = [measure_import(module, home) for _ in range(runs)]
+    timings = sorted(result["elapsed_ms"] for result in results)
+    median_ms = statistics.median(timings)
+    loaded = [name for name in tkc.IMPORT_BUDGET_DEFERRED
+              if any(name in result["modules"] for result in results)]
+
+    print(f"import {module}: median {median_ms:.1f} ms, min {timings[0]:.1f} ms, "
+          f"max {timings[-1]:.1f} ms, budget {budget_ms} ms")
+    passed = True
+    if median_ms > budget_ms:
+        print(f"FAIL: median import time is over budget by {median_ms - budget_ms:.1f} ms")
+        passed = False
+    for name in loaded:
+        print(f"FAIL: {name} was imported, it should load on first use")
+        passed = False
+    if passed:
+        print("OK")
+    return passed
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fails when cold-importing a module is over the time budget, or when it "
+                    "pulls in a module that should load on first use (tkc.IMPORT_BUDGET_DEFERRED).")
+    parser.add_argument("modules", nargs="*", default=["ui.main_window"],
+                        help="modules to import, each in fresh interpreters (default: ui.main_window)")
+    parser.add_argument("--runs", type=int, default=tkc.IMPORT_BUDGET_RUNS,
+                        help="fresh interpreters per module, the median import time is checked")
+    parser.add_argument("--budget", type=float, default=tkc.IMPORT_BUDGET_MS,
+                        help="allowed median import time in milliseconds")
+    options = parser.parse_args(argv)
+
+    results = [check_module(module, options.runs, options.budget) for module in options.modules]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
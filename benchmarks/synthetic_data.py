@@ -0,0 +1,340 @@
+import argparse
+import datetime
+import math
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from bench_common import create_schema
+from database.database_utility.table_columns import (
+    TABLE_DATE_COLUMNS, TABLE_TIME_COLUMNS, TABLE_SLIDER_COLUMNS)
+
+# synthetic_data.py
+# Seeded generator of realistic tracker data for load tests: multi-year histories
+# with mood episodes, weekday effects, a daily rhythm and days without entries.
+# The schema comes from the app's own DataManager; the rows are expanded inside SQLite.
+#
+#   python benchmarks/synthetic_data.py [--years 5] [--entries-per-day 4] [--seed 0] [--home DIR]
+
+# Mood episodes: (name, mean length in days, weight when a new episode starts)
+EPISODES = (
+    ("euthymic", 40, 6),
+    ("depressive", 21, 2),
+    ("hypomanic", 10, 1),
+    ("mixed", 7, 1),
+)
+
+# Latent day levels per episode, on the 0-10 slider scale:
+# mood, mania, depression, mixed risk, energy, stress, calm, rage
+EPISODE_LEVELS = {
+    "euthymic": (6.0, 1.0, 1.5, 0.5, 6.0, 4.0, 6.0, 1.0),
+    "depressive": (2.5, 0.5, 7.0, 1.5, 2.5, 6.0, 3.5, 2.0),
+    "hypomanic": (8.0, 7.0, 0.5, 2.0, 8.5, 3.5, 4.0, 3.0),
+    "mixed": (4.0, 5.0, 5.5, 7.0, 6.0, 7.5, 2.0, 5.5),
+}
+
+# Relative chance of an entry in each hour of the day, awake hours dominate
+HOUR_WEIGHTS = (1, 0.5, 0.3, 0.2, 0.2, 0.3, 1, 4, 6, 6, 5, 5, 6, 5, 4, 4, 5, 6, 7, 7, 6, 5, 3, 2)
+HOURS = range(24)
+
+# Energy and focus follow the daily rhythm: low early and late, peaking around midday
+HOUR_ENERGY = tuple(1.5 * math.sin(math.pi * (hour - 6) / 16) if 6 <= hour <= 22 else -1.5
+                    for hour in HOURS)
+
+# Per-table slider expressions over a day's latent levels, the hour's rhythm and four
+# noise terms n1..n4, in TABLE_SLIDER_COLUMNS order
+SLIDER_EXPRESSIONS = {
+    "wefe_table": ("mood - 0.5 * weekday_stress + n1",
+                   "mania + 0.5 * mood - 2 + n2",
+                   "energy + rhythm - 0.5 * depression + 2 + n3",
+                   "energy + rhythm + n4"),
+    "cspr_table": ("calm - 0.3 * rhythm - n1",
+                   "stress + weekday_stress + n1",
+                   "2 + 0.3 * depression + 1.5 + 1.2 * n3",
+                   "rage + 0.3 * stress + n4"),
+    "mental_mental_table": ("mood + n1",
+                            "mania + 0.8 * n2",
+                            "depression + 0.8 * n3",
+                            "mixed + 0.8 * n4"),
+}
+
+HASH_MODULUS = 2147483648
+ENTRY_SLOTS = 4096  # entries per day are capped below this
+TIME_SLOTS = 65536  # resolution of the time-of-day distribution
+NOISE_SLOTS = 65536  # pre-drawn noise terms entries pick from
+NOISE_STD = 0.7  # standard deviation of the per-entry noise terms
+BENCHMARK_SPAN_YEARS = 10  # longest history fill_database generates
+
+
+def hash_sql(key: str, salt: int) -> str:
+    """
+    Returns an SQL expression mapping an integer key to a pseudo-random integer below
+    HASH_MODULUS, as two rounds of a linear congruential generator.
+
+    SQLite's random() can't be seeded, so entries pick their draws by a hash of their
+    key, the seed and a salt, which keeps the output reproducible. The intermediate
+    products stay below 2**63 for keys below 2**33.
+    """
+    return (f"(((({key}) * 1103515245 + {salt}) % {HASH_MODULUS}) * 1103515245 + 12345)"
+            f" % {HASH_MODULUS}")
+
+
+def clamp_sql(expression: str) -> str:
+    """Returns an SQL expression rounding expression to a slider value, 0 to 10."""
+    return f"MAX(0, MIN(10, CAST(({expression}) + 20.5 AS INTEGER) - 20))"
+
+
+class Day:
+    """The latent state shared by every table's entries of one day."""
+
+    __slots__ = ("date", "levels", "weekday_stress")
+
+    def __init__(self, date: str, levels: Tuple[float, ...], weekday_stress: float) -> None:
+        self.date = date
+        self.levels = levels
+        self.weekday_stress = weekday_stress
+
+
+def simulate_days(start: datetime.date, days: int, rng: random.Random,
+                  missing_rate: float, gap_rate: float) -> List[Optional[Day]]:
+    """
+    Simulates the latent state of every day, None for days without entries.
+
+    Episodes follow each other with exponentially distributed lengths. Their levels
+    drift from day to day, so neighbouring days look alike. Single days are skipped
+    with missing_rate, and with gap_rate a gap of one to three weeks starts.
+
+    Args:
+        start (datetime.date): The first day.
+        days (int): The number of days.
+        rng (random.Random): The seeded generator.
+        missing_rate (float): Chance that a single day has no entries.
+        gap_rate (float): Chance, per day, that a multi-week gap starts.
+
+    Returns:
+        List[Optional[Day]]: One entry per day, oldest first.
+    """
+    names = [name for name, _, _ in EPISODES]
+    weights = [weight for _, _, weight in EPISODES]
+    lengths = {name: length for name, length, _ in EPISODES}
+    result: List[Optional[Day]] = []
+    episode, remaining = "euthymic", 0
+    drift = [0.0] * len(EPISODE_LEVELS["euthymic"])
+    gap = 0
+    for offset in range(days):
+        if remaining <= 0:
+            episode = rng.choices(names, weights)[0]
+            remaining = max(1, int(rng.expovariate(1 / lengths[episode])))
+        remaining -= 1
+        drift = [0.8 * value + rng.gauss(0, 0.4) for value in drift]
+        if gap:
+            gap -= 1
+            result.append(None)
+            continue
+        if rng.random() < gap_rate:
+            gap = rng.randint(7, 21)
+            result.append(None)
+            continue
+        if rng.random() < missing_rate:
+            result.append(None)
+            continue
+        date = start + datetime.timedelta(days=offset)
+        weekday_stress = 1.0 if date.weekday() < 5 else -1.0
+        levels = tuple(level + change for level, change in zip(EPISODE_LEVELS[episode], drift))
+        result.append(Day(date.isoformat(), levels, weekday_stress))
+    return result
+
+
+def table_columns(table_name: str) -> List[str]:
+    """Returns the columns the generator fills for table_name."""
+    columns = [TABLE_DATE_COLUMNS[table_name], TABLE_TIME_COLUMNS[table_name]]
+    columns += TABLE_SLIDER_COLUMNS[table_name]
+    columns.append("summing_box" if table_name == "wefe_table" else "anomaly_flag")
+    return columns
+
+
+def insert_sql(table_name: str, salt: int) -> str:
+    """
+    Returns the INSERT that expands synthetic_days into the entries of one table.
+
+    Every day is joined with as many sequence numbers as it has entries. Entry i of
+    a day with n entries takes its time from the i-th of n equal strata of the sorted
+    synthetic_times, at a hashed offset, so times follow HOUR_WEIGHTS and come out in
+    order without a sort. Its noise terms are a hashed row of synthetic_noise, and its
+    sliders follow SLIDER_EXPRESSIONS. The CROSS JOIN pins the days as the outer loop,
+    so rows come out day by day without a sort and ids grow with time as in the app.
+
+    Args:
+        table_name (str): One of the tracker tables.
+        salt (int): Makes the table's draws independent of the other tables'.
+
+    Returns:
+        str: The statement, taking the :entry_slots and :max_entries parameters.
+    """
+    key = "d.day_index * :entry_slots + seq.i"
+    sliders = ", ".join(f"{clamp_sql(expression)} AS v{number}"
+                        for number, expression in enumerate(SLIDER_EXPRESSIONS[table_name], 1))
+    last = "v1 + v2 + v3 + v4" if table_name == "wefe_table" else "0"
+    return f"""
+        WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i + 1 < :max_entries)
+        INSERT INTO {table_name}({', '.join(table_columns(table_name))})
+        SELECT day, time, v1, v2, v3, v4, {last}
+        FROM (SELECT d.day_index, d.day, t.time, {sliders}
+              FROM synthetic_days AS d
+              CROSS JOIN seq ON seq.i < d.entries
+              JOIN synthetic_times AS t
+                  ON t.slot = (seq.i * {TIME_SLOTS} + {hash_sql(key, salt)} % {TIME_SLOTS}) / d.entries
+              JOIN synthetic_noise AS n
+                  ON n.slot = {hash_sql(key, salt + 1)} % {NOISE_SLOTS})
+"""
+
+
+def generate_database(db_path: str, years: float = 5, entries_per_day: float = 4,
+                      seed: int = 0, rows: Optional[int] = None, missing_rate: float = 0.08,
+                      gap_rate: float = 0.003, end: Optional[datetime.date] = None) -> Dict[str, int]:
+    """
+    Fills every tracker table of a database created by create_schema.
+
+    The day-level history is simulated in Python, which is cheap: a few thousand days.
+    The entries are expanded from it inside SQLite, by one INSERT ... SELECT per table,
+    so millions of rows never pass through the interpreter. The tables share the
+    history, so their values move together through episodes.
+
+    The tables' change-log triggers would fire once per row, so they are dropped for
+    the load and recreated from their stored SQL, and each table's change-log sequence
+    is bumped once instead. The journal and fsyncs are off while loading.
+
+    Args:
+        db_path (str): The database.
+        years (float): Length of the history.
+        entries_per_day (float): Mean entries per table on a tracked day, below ENTRY_SLOTS.
+        seed (int): Seed of the generator; the same seed gives the same rows.
+        rows (int): If given, exactly this many rows per table, the newest ones of a
+            history sized to hold them. years is ignored.
+        missing_rate (float): Chance that a day has no entries.
+        gap_rate (float): Chance, per day, that a gap of one to three weeks starts.
+        end (datetime.date): The last day of the history, defaults to yesterday.
+
+    Returns:
+        Dict[str, int]: The rows written per table.
+    """
+    rng = random.Random(seed)
+    end = end or datetime.date.today() - datetime.timedelta(days=1)
+    if rows is not None:
+        tracked_share = (1 - missing_rate) * (1 - 14 * gap_rate)
+        span = int(rows / (entries_per_day * tracked_share) * 1.2) + 30
+    else:
+        span = int(years * 365.25)
+    history = simulate_days(end - datetime.timedelta(days=span - 1), span, rng, missing_rate, gap_rate)
+    days = []
+    for day_index, day in enumerate(history):
+        if day is not None:
+            entries = int(rng.gauss(entries_per_day, entries_per_day * 0.3) + 0.5)
+            days.append((day_index, day.date, min(max(entries, 1), ENTRY_SLOTS - 1),
+                         day.weekday_stress) + day.levels)
+    if rows is not None:
+        total = sum(day[2] for day in days)
+        if total < rows:
+            raise ValueError(f"history of {span} days holds {total} entries, fewer than {rows}")
+        while total - days[0][2] >= rows:
+            total -= days.pop(0)[2]
+        days[0] = days[0][:2] + (days[0][2] - (total - rows),) + days[0][3:]
+
+    seconds = sorted(hour * 3600 + rng.randrange(3600)
+                     for hour in rng.choices(HOURS, HOUR_WEIGHTS, k=TIME_SLOTS))
+    times = [(slot, f"{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}",
+              HOUR_ENERGY[second // 3600]) for slot, second in enumerate(seconds)]
+    noise = [(slot,) + tuple(rng.gauss(0, NOISE_STD) for _ in range(4)) for slot in range(NOISE_SLOTS)]
+
+    written = {}
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        connection.execute("PRAGMA cache_size = -65536")
+        connection.execute("""CREATE TEMP TABLE synthetic_days (
+                                day_index INTEGER PRIMARY KEY, day TEXT, entries INTEGER,
+                                weekday_stress REAL, mood REAL, mania REAL, depression REAL,
+                                mixed REAL, energy REAL, stress REAL, calm REAL, rage REAL)""")
+        connection.executemany(f"INSERT INTO synthetic_days VALUES ({', '.join('?' * 12)})", days)
+        connection.execute("CREATE TEMP TABLE synthetic_times "
+                           "(slot INTEGER PRIMARY KEY, time TEXT, rhythm REAL)")
+        connection.executemany("INSERT INTO synthetic_times VALUES (?, ?, ?)", times)
+        connection.execute("CREATE TEMP TABLE synthetic_noise "
+                           "(slot INTEGER PRIMARY KEY, n1 REAL, n2 REAL, n3 REAL, n4 REAL)")
+        connection.executemany("INSERT INTO synthetic_noise VALUES (?, ?, ?, ?, ?)", noise)
+
+        parameters = {"entry_slots": ENTRY_SLOTS, "max_entries": max(day[2] for day in days)}
+        for table_index, table_name in enumerate(TABLE_SLIDER_COLUMNS):
+            salt = (seed * 7919 + table_index * 101) % HASH_MODULUS
+            with connection:
+                triggers = connection.execute("SELECT name, sql FROM sqlite_master "
+                                              "WHERE type = 'trigger' AND tbl_name = ?",
+                                              (table_name,)).fetchall()
+                for name, _ in triggers:
+                    connection.execute(f"DROP TRIGGER {name}")
+                changes = connection.total_changes
+                connection.execute(insert_sql(table_name, salt), parameters)
+                written[table_name] = connection.total_changes - changes
+                for _, sql in triggers:
+                    connection.execute(sql)
+                if triggers:
+                    connection.execute("UPDATE change_log_table SET seq = seq + 1 WHERE source_table = ?",
+                                       (table_name,))
+    finally:
+        connection.close()
+    return written
+
+
+def fill_database(db_path: str, rows: int, seed: int = 0) -> None:
+    """
+    Fills every tracker table with exactly rows entries, for the benchmarks.
+
+    The history spans at most BENCHMARK_SPAN_YEARS; larger tables get more entries
+    per day rather than reaching further back.
+
+    Args:
+        db_path (str): A database created by create_schema.
+        rows (int): Rows per table.
+        seed (int): Seed of the generator.
+
+    Returns:
+        None
+    """
+    if rows > 0:
+        entries_per_day = max(4.0, rows / (BENCHMARK_SPAN_YEARS * 365.25 * 0.8))
+        generate_database(db_path, entries_per_day=entries_per_day, seed=seed, rows=rows)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Generates a synthetic tracker database.")
+    parser.add_argument("--years", type=float, default=5, help="length of the history")
+    parser.add_argument("--entries-per-day", type=float, default=4,
+                        help="mean entries per table on a tracked day")
+    parser.add_argument("--rows", type=int, help="exact rows per table, overrides --years")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random generator")
+    parser.add_argument("--home", help="home directory to create the database in, "
+                                       "defaults to a new temporary directory")
+    options = parser.parse_args(argv)
+
+    home = options.home or tempfile.mkdtemp(prefix="tracker-synthetic-")
+    os.makedirs(home, exist_ok=True)
+    start = time.perf_counter()
+    db_path = create_schema(home)
+    written = generate_database(db_path, options.years, options.entries_per_day,
+                                options.seed, options.rows)
+    elapsed = time.perf_counter() - start
+    for table_name, count in written.items():
+        print(f"{table_name:<22} {count:>10,} rows")
+    print(f"{sum(written.values()):,} rows in {elapsed:.1f} s: {db_path}")
+    print(f"run the app against it with HOME={home}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,164 @@
+import argparse
+import os
+import sys
+import tempfile
+from typing import Dict, List
+
+from bench_common import (
+    RESULTS_DIRECTORY, append_history, run_python, summarize_samples, write_json)
+
+# window_resize.py
+# Times the resize handling of the frameless window in a fresh offscreen
+# interpreter: an interactive drag sweep and the page switches' sizes, each with the
+# mask cache cleared before every resize and with it warm, and whole page switches
+# through MainWindow.show_page.
+#
+#   python benchmarks/window_resize.py [--heights 460 1080] [--repeats 5] [--save-baseline]
+
+PROBE = """
+import json, sys
+sys.path.insert(0, "benchmarks")
+from window_resize import probe
+print(json.dumps(probe(*map(int, sys.argv[1:]))))
+"""
+
+SWEEP_STEPS = 60  # resizes of one drag, out to the largest size and back
+# mainStack pages in a typical order of switching, MMDM, its table, WEFE, diagnostics...
+PAGE_ORDER = [0, 3, 1, 7, 4, 5, 2]
+# the unit of each metric family, by the metric name's first component
+METRIC_UNITS = {"resize": "ms per resize event", "show_page": "ms per page switch"}
+
+
+def probe(height: int, repeats: int) -> Dict[str, List[float]]:
+    """
+    Runs every measurement in this process.
+
+    Called in the benchmark child. resize.* samples are milliseconds per resize
+    event, as handled by FramelessWindow.resizeEvent including setMask, show_page.*
+    samples milliseconds per page switch of the main window, with its pages built.
+
+    Args:
+        height (int): The height the drag sweep grows the window to.
+        repeats (int): How often each measurement is repeated.
+
+    Returns:
+        Dict[str, List[float]]: The samples of every metric.
+    """
+    import time
+    from PyQt6.QtCore import QSize
+    from PyQt6.QtGui import QResizeEvent
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    from navigation.master_navigation import PAGE_SIZES
+    from utility.app_operations.frameless_window import FramelessWindow, rounded_mask
+    from ui.main_window import MainWindow
+
+    window = FramelessWindow()
+    window.resize(320, 390)
+    window.show()
+    app.processEvents()
+    half = SWEEP_STEPS // 2
+    grow = [QSize(320 + (height * 4 // 3 - 320) * step // half, 390 + (height - 390) * step // half)
+            for step in range(1, half + 1)]
+    sweep = grow + grow[-2::-1]
+    page_switches = [QSize(*PAGE_SIZES[index]) for index in PAGE_ORDER]
+    samples: Dict[str, List[float]] = {}
+
+    def resize_through(sizes: List[QSize], cached: bool) -> float:
+        previous = window.size()
+        start = time.perf_counter()
+        for size in sizes:
+            if not cached:
+                rounded_mask.cache_clear()
+            window.resizeEvent(QResizeEvent(size, previous))
+            previous = size
+        return (time.perf_counter() - start) * 1000 / len(sizes)
+
+    for _ in range(repeats):
+        for name, sizes in (("drag_sweep", sweep), ("page_switch", page_switches)):
+            for cached in (False, True):
+                window.mask_size = None
+                metric = f"resize.{name}.{'cached' if cached else 'uncached'}"
+                samples.setdefault(metric, []).append(resize_through(sizes, cached))
+        # A resize event that doesn't change the size
+        window.mask_size = None
+        resize_through([QSize(800, 460)], True)
+        samples.setdefault("resize.same_size", []).append(
+            resize_through([QSize(800, 460)] * len(page_switches), True))
+    window.close()
+
+    main_window = MainWindow()
+    main_window.show()
+    for index in PAGE_ORDER:
+        main_window.page_loader.ensure_built(index)
+    app.processEvents()
+
+    def switch_through(pages: List[int]) -> float:
+        start = time.perf_counter()
+        for index in pages:
+            main_window.show_page(index)
+            app.processEvents()
+        return (time.perf_counter() - start) * 1000 / len(pages)
+
+    for _ in range(repeats):
+        samples.setdefault("show_page.switch", []).append(switch_through(PAGE_ORDER))
+        samples.setdefault("show_page.same_page", []).append(
+            switch_through([PAGE_ORDER[-1]] * len(PAGE_ORDER)))
+    app.quit()
+    return samples
+
+
+def benchmark_height(height: int, repeats: int) -> Dict[str, dict]:
+    """
+    Measures resizing with a drag sweep up to the given window height.
+
+    Args:
+        height (int): The height the drag sweep grows the window to.
+        repeats (int): How often each measurement is repeated.
+
+    Returns:
+        Dict[str, dict]: metric -> {"median", "min", "max"}.
+    """
+    with tempfile.TemporaryDirectory() as home:
+        samples = run_python(PROBE, home, [str(height), str(repeats)])
+    return {metric: summarize_samples(values) for metric, values in sorted(samples.items())}
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Headless benchmark of frameless window resizing.")
+    parser.add_argument("--heights", type=int, nargs="+", default=[460, 1080],
+                        help="window heights the drag sweep grows to")
+    parser.add_argument("--repeats", type=int, default=5, help="repetitions of each measurement")
+    parser.add_argument("--history", default=os.path.join(RESULTS_DIRECTORY, "window_resize.json"),
+                        help="JSON history the results are appended to")
+    parser.add_argument("--save-baseline", nargs="?", metavar="FILE",
+                        const=os.path.join(RESULTS_DIRECTORY, "window_resize_baseline.json"),
+                        help="also store the results as a baseline for compare.py")
+    options = parser.parse_args(argv)
+
+    sizes = {}
+    for height in options.heights:
+        sizes[str(height)] = summary = benchmark_height(height, options.repeats)
+        print(f"{height:>9} px")
+        for metric, values in summary.items():
+            print(f"    {metric:<42} {values['median']:10.3f} {METRIC_UNITS[metric.split('.')[0]]}  "
+                  f"({values['min']:.3f} - {values['max']:.3f})")
+
+    record = {
+        "benchmark": "window_resize",
+        "repeats": options.repeats,
+        "size_label": "px",
+        "unit": "milliseconds, per resize event for resize.* and per page switch for show_page.*",
+        "metric_units": METRIC_UNITS,
+        "sizes": sizes,
+    }
+    stamped = append_history(options.history, record)
+    print(f"appended to {options.history}")
+    if options.save_baseline:
+        write_json(options.save_baseline, stamped)
+        print(f"saved baseline {options.save_baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,6 +1,8 @@
 from PyQt6.QtCore import QDate, QTime
 import tracker_config as tkc
 from logger_setup import logger
+from database.database_utility.query_log import query_log
+from utility.app_operations.memory_profiler import memory_profiler
 
 
 def add_wefe_data(main_window_instance, widget_names, db_insert_method):
@@ -28,6 +30,7 @@ def add_wefe_data(main_window_instance, widget_names, db_insert_method):
     try:
         db_insert_method(*data_to_insert)
         reset_wefe_data(main_window_instance, widget_names)
+        memory_profiler.checkpoint("commit.wefe_table")
     except Exception as e:
         logger.error(f"Error inserting data into the database: {e}")
 
@@ -41,6 +44,9 @@ def reset_wefe_data(main_window_instance, widget_names):
         getattr(main_window_instance, widget_names['focus_slider']).setValue(0)
         getattr(main_window_instance, widget_names['energy_slider']).setValue(0)
         getattr(main_window_instance, widget_names['summing_box']).setValue(0)
-        getattr(main_window_instance, widget_names['model']).select()
+        # The table view page, and with it the model, may not have been built yet
+        model = getattr(main_window_instance, widget_names['model'], None)
+        if model is not None:
+            query_log.select(model)
     except Exception as e:
         logger.error(f"Error resetting pain levels form: {e}")
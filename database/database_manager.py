@@ -1,28 +1,87 @@
 # from sexy_logger import logger
 import tracker_config as tkc
+from PyQt6.QtCore import QSettings, QThread, pyqtSignal
 from PyQt6.QtSql import QSqlDatabase, QSqlQuery
 import os
-import shutil
+import pathlib
+import sqlite3
+from typing import Callable, Optional
 from logger_setup import logger
+from database.database_utility.query_log import query_log
+from utility.app_operations.startup_profiler import startup_profiler
+from utility.app_operations.instrumentation import timed
+from analytics.heatmap import setup_heatmap_tables, refresh_heatmap
+from analytics.forecasting import forecaster
+from analytics.anomaly_flags import setup_slider_stats_table, AnomalyScorer
+from analytics.result_cache import setup_change_log
 
 user_dir = os.path.expanduser('~')
 db_path = os.path.join(os.getcwd(), tkc.DB_NAME)  # Database Name
 target_db_path = os.path.join(user_dir, tkc.DB_NAME)  # Database Name
 
 
-def initialize_database():
+def database_provisioned() -> bool:
+    """Returns whether initialize_database has already provisioned the database."""
+    settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+    return settings.value("provisionedDatabase", "", type=str) == target_db_path
+
+
+def initialize_database(progress: Optional[Callable[[int, int], None]] = None) -> None:
+    """
+    Provisions the database in the home directory on first launch.
+
+    If a seed database sits in the working directory, it is copied with SQLite's online
+    backup API, DB_PROVISION_PAGES_PER_STEP pages at a time, into a temporary file that
+    is moved into place once complete, so a large seed never leaves a half-copied
+    database behind. Without a seed nothing is copied; opening the database creates it.
+
+    Once provisioned, the target path is stored in QSettings and later launches return
+    without touching the filesystem.
+
+    Args:
+        progress (Callable[[int, int], None]): Called after each step with the pages
+            remaining and the total page count, e.g. to repaint a splash screen.
+
+    Returns:
+        None
+    """
+    if database_provisioned():
+        return
     try:
-        if not os.path.exists(target_db_path):
-            if os.path.exists(db_path):
-                shutil.copy(db_path, target_db_path)
-            else:
-                db = QSqlDatabase.addDatabase('QSQLITE')
-                db.setDatabaseName(target_db_path)
-                if not db.open():
-                    logger.error("Error: Unable to create database")
-                db.close()
+        if not os.path.exists(target_db_path) and os.path.exists(db_path):
+            partial_path = f"{target_db_path}.partial"
+
+            def report(status: int, remaining: int, total: int) -> None:
+                if progress is not None:
+                    progress(remaining, total)
+
+            source = sqlite3.connect(f"{pathlib.Path(db_path).as_uri()}?mode=ro", uri=True)
+            target = sqlite3.connect(partial_path)
+            try:
+                source.backup(target, pages=tkc.DB_PROVISION_PAGES_PER_STEP, progress=report)
+            finally:
+                target.close()
+                source.close()
+            os.replace(partial_path, target_db_path)
+            logger.info(f"Provisioned database from {db_path}")
+        QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME).setValue("provisionedDatabase", target_db_path)
     except Exception as e:
-        logger.error("Error: Unable to create database", str(e))
+        logger.error(f"Error: Unable to provision database {e}", exc_info=True)
+
+
+class DatabaseProvisioner(QThread):
+    """
+    Runs initialize_database on a worker thread.
+
+    The backup only uses its own sqlite3 connections, so it doesn't need the GUI
+    thread, which keeps processing events meanwhile. progress is emitted after every
+    backup step with the pages remaining and the total page count, and reaches
+    receivers on the GUI thread through a queued connection.
+    """
+    progress = pyqtSignal(int, int)
+
+    def run(self) -> None:
+        initialize_database(self.progress.emit)
 
 
 class DataManager:
@@ -30,6 +89,9 @@ class DataManager:
     def __init__(self,
                  db_name=target_db_path):
         try:
+            if db_name == target_db_path:
+                with startup_profiler.phase("initialize_database"):
+                    initialize_database()
             self.db = QSqlDatabase.addDatabase('QSQLITE')
             self.db.setDatabaseName(db_name)
             
@@ -37,7 +99,9 @@ class DataManager:
                 logger.error("Error: Unable to open database")
             logger.info("DB INITIALIZING")
             self.query = QSqlQuery()
-            self.setup_tables()
+            with startup_profiler.phase("setup_tables"):
+                self.setup_tables()
+            self.anomaly_scorer = AnomalyScorer()
         except Exception as e:
             logger.error(f"Error: Unable to open database {e}", exc_info=True)
     
@@ -45,7 +109,60 @@ class DataManager:
         self.setup_wefe_table()
         self.setup_into_cspr_exam()
         self.setup_mental_mental_table()
+        setup_heatmap_tables(self.query)
+        setup_slider_stats_table(self.query)
+        setup_change_log(self.query)
     
+    @staticmethod
+    def refresh_analytics(table_name: str) -> None:
+        """
+        Folds newly committed rows of table_name into the incremental analytics.
+
+        Args:
+            table_name (str): The table that was just written to.
+
+        Returns:
+            None
+        """
+        refresh_heatmap(table_name)
+        forecaster.update(table_name)
+    
+    def score_anomaly(self, table_name: str, slider_values: dict) -> int:
+        """
+        Computes the anomaly flag of a row about to be inserted.
+
+        A scoring failure must not cost the entry, so it is logged and the row is
+        stored unflagged.
+
+        Args:
+            table_name (str): The table the row goes into.
+            slider_values (dict): The row's slider values by column name.
+
+        Returns:
+            int: The anomaly bitmask, 0 when nothing deviates or scoring failed.
+        """
+        try:
+            return self.anomaly_scorer.score(table_name, slider_values)
+        except Exception as e:
+            logger.error(f"Error scoring anomalies: {table_name} {e}", exc_info=True)
+            return 0
+
+    def update_anomaly_stats(self, table_name: str, slider_values: dict) -> None:
+        """
+        Folds an inserted row into the anomaly statistics, logging any failure.
+
+        Args:
+            table_name (str): The table the row went into.
+            slider_values (dict): The row's slider values by column name.
+
+        Returns:
+            None
+        """
+        try:
+            self.anomaly_scorer.update(table_name, slider_values)
+        except Exception as e:
+            logger.error(f"Error updating anomaly statistics: {table_name} {e}", exc_info=True)
+
     def setup_mental_mental_table(self) -> None:
         """
         Sets up the 'mental_mental_table' in the database if it doesn't already exist.
@@ -58,13 +175,14 @@ class DataManager:
         - mania_slider: INTEGER
         - depression_slider: INTEGER
         - mixed_risk_slider: INTEGER
+        - anomaly_flag: INTEGER
 
         If the table already exists, this method does nothing.
 
         Returns:
             None
         """
-        if not self.query.exec(f"""
+        if not query_log.exec(self.query, f"""
                                     CREATE TABLE IF NOT EXISTS mental_mental_table (
                                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                                     mental_mental_date TEXT,
@@ -72,11 +190,13 @@ class DataManager:
                                     mood_slider INTEGER,
                                     mania_slider INTEGER,
                                     depression_slider INTEGER,
-                                    mixed_risk_slider INTEGER
+                                    mixed_risk_slider INTEGER,
+                                    anomaly_flag INTEGER DEFAULT 0
                                     )"""):
             logger.error(f"Error creating table: mental_mental_table",
                          self.query.lastError().text())
     
+    @timed("db.insert.mental_mental_table")
     def insert_into_mental_mental_table(self,
                                         mental_mental_date: int,
                                         mental_mental_time: int,
@@ -109,28 +229,36 @@ class DataManager:
                     mood_slider,
                     mania_slider,
                     depression_slider,
-                    mixed_risk_slider) VALUES (?, ?, ?, ?, ?, ?)"""
+                    mixed_risk_slider,
+                    anomaly_flag) VALUES (?, ?, ?, ?, ?, ?, ?)"""
         
-        bind_values: List[Union[str, int]] = [mental_mental_date, mental_mental_time,
-                                              mood_slider, mania_slider, depression_slider,
-                                              mixed_risk_slider]
+        slider_values = {"mood_slider": mood_slider, "mania_slider": mania_slider,
+                         "depression_slider": depression_slider,
+                         "mixed_risk_slider": mixed_risk_slider}
         try:
+            anomaly_flag = self.score_anomaly("mental_mental_table", slider_values)
+            bind_values: List[Union[str, int]] = [mental_mental_date, mental_mental_time,
+                                                  mood_slider, mania_slider, depression_slider,
+                                                  mixed_risk_slider, anomaly_flag]
             self.query.prepare(sql)
             for value in bind_values:
                 self.query.addBindValue(value)
             if sql.count('?') != len(bind_values):
                 raise ValueError(f"""Mismatch: mental_mental_table Expected {sql.count('?')}
                                 bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
+            if not query_log.exec(self.query):
                 logger.error(
                     f"Error inserting data: mental_mental_table - {self.query.lastError().text()}")
+            else:
+                self.update_anomaly_stats("mental_mental_table", slider_values)
+                self.refresh_analytics("mental_mental_table")
         except ValueError as e:
             logger.error(f"ValueError mental_mental_table: {e}")
         except Exception as e:
             logger.error(f"Error during data insertion: mental_mental_table {e}", exc_info=True)
     
     def setup_into_cspr_exam(self) -> None:
-        if not self.query.exec(f"""
+        if not query_log.exec(self.query, f"""
                                     CREATE TABLE IF NOT EXISTS cspr_table (
                                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                                     cspr_date TEXT,
@@ -138,11 +266,13 @@ class DataManager:
                                     calm_slider INTEGER,
                                     stress_slider INTEGER,
                                     pain_slider INTEGER,
-                                    rage_slider INTEGER
+                                    rage_slider INTEGER,
+                                    anomaly_flag INTEGER DEFAULT 0
                                     )"""):
             logger.error(f"Error creating table: cspr_table",
                          self.query.lastError().text())
     
+    @timed("db.insert.cspr_table")
     def insert_into_cspr_exam(self,
                               cspr_date: str,
                               cspr_time: str,
@@ -158,27 +288,35 @@ class DataManager:
                     calm_slider,
                     stress_slider,
                     pain_slider,
-                    rage_slider) VALUES (?, ?, ?, ?, ?, ?)"""
+                    rage_slider,
+                    anomaly_flag) VALUES (?, ?, ?, ?, ?, ?, ?)"""
         
-        bind_values: List[Union[str, int]] = [cspr_date, cspr_time,
-                                              calm_slider, stress_slider, pain_slider, rage_slider]
+        slider_values = {"calm_slider": calm_slider, "stress_slider": stress_slider,
+                         "pain_slider": pain_slider, "rage_slider": rage_slider}
         try:
+            anomaly_flag = self.score_anomaly("cspr_table", slider_values)
+            bind_values: List[Union[str, int]] = [cspr_date, cspr_time,
+                                                  calm_slider, stress_slider, pain_slider, rage_slider,
+                                                  anomaly_flag]
             self.query.prepare(sql)
             for value in bind_values:
                 self.query.addBindValue(value)
             if sql.count('?') != len(bind_values):
                 raise ValueError(f"""Mismatch: cspr_table Expected {sql.count('?')}
                                 bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
+            if not query_log.exec(self.query):
                 logger.error(
                     f"Error inserting data: cspr_table - {self.query.lastError().text()}")
+            else:
+                self.update_anomaly_stats("cspr_table", slider_values)
+                self.refresh_analytics("cspr_table")
         except ValueError as e:
             logger.error(f"ValueError cspr_table: {e}")
         except Exception as e:
             logger.error(f"Error during data insertion: cspr_table {e}", exc_info=True)
     
     def setup_wefe_table(self) -> None:
-        if not self.query.exec(f"""
+        if not query_log.exec(self.query, f"""
                                 CREATE TABLE IF NOT EXISTS wefe_table (
                                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                                 wefe_date TEXT,
@@ -192,6 +330,7 @@ class DataManager:
             logger.error(f"Error creating table: wefe_table",
                          self.query.lastError().text())
     
+    @timed("db.insert.wefe_table")
     def insert_into_wefe_table(self,
                                wefe_date: str,
                                wefe_time: str,
@@ -225,9 +364,11 @@ class DataManager:
             if sql.count('?') != len(bind_values):
                 raise ValueError(f"""Mismatch: wefe_table Expected {sql.count('?')}
                             bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
+            if not query_log.exec(self.query):
                 logger.error(
                     f"Error inserting data: wefe_table - {self.query.lastError().text()}")
+            else:
+                self.refresh_analytics("wefe_table")
         except ValueError as e:
             logger.error(f"ValueError wefe_table: {e}")
         except Exception as e:
@@ -1,6 +1,9 @@
 from PyQt6.QtWidgets import QTableView, QMainWindow
 from logger_setup import logger
+from database.database_utility.query_log import query_log
+from utility.app_operations.instrumentation import timed
 
+@timed("db.delete_selected_rows")
 def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_name: str,
                          model_name: str):
     """
@@ -17,10 +20,11 @@ def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_na
     """
     try:
         # Retrieve the QTableView and model instances from the main window
-        table_view: QTableView = getattr(main_window_instance, table_view_widget_name)
-        model = getattr(main_window_instance, model_name)  # The model's specific type could vary
+        # Either is missing while the table view page hasn't been built yet
+        table_view: QTableView = getattr(main_window_instance, table_view_widget_name, None)
+        model = getattr(main_window_instance, model_name, None)  # The model's specific type could vary
 
-        if table_view is not None:
+        if table_view is not None and model is not None:
             # Get indices of selected rows, sorted in reverse order for deletion
             selected_rows = table_view.selectionModel().selectedRows()
             rows_to_delete = sorted([index.row() for index in selected_rows], reverse=True)
@@ -31,7 +35,7 @@ def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_na
 
             # Submit changes and refresh the model
             model.submitAll()
-            model.select()
+            query_log.select(model)
 
     except Exception as e:
         logger.error(f"An error occurred while deleting records: {str(e)}")
@@ -1,14 +1,22 @@
 from PyQt6 import QtSql
 from PyQt6.QtWidgets import QAbstractItemView
 from logger_setup import logger
+from database.database_utility.query_log import query_log, TimedSqlTableModel
+from utility.app_operations.instrumentation import timed
+from analytics.heatmap import invalidate_heatmap_on_edit
+from analytics.forecasting import invalidate_forecasts_on_edit
 
 # model_setup.py
 
 
+@timed("model.create_and_set")
 def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtSql.QSqlTableModel:
     """
     Creates and sets up a QSqlTableModel for the specified table name and view widget.
 
+    The model is a TimedSqlTableModel, so its deletes and in-cell edits are timed by
+    the query log like every other statement.
+
     Args:
         table_name (str): The name of the table to create the model for.
         view_widget (QAbstractItemView): The view widget to set the model on.
@@ -17,14 +25,16 @@ def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtS
         QSqlTableModel: The created QSqlTableModel.
 
     """
-    model = QtSql.QSqlTableModel()
+    model = TimedSqlTableModel()
     model.setTable(table_name)
     model.setEditStrategy(QtSql.QSqlTableModel.EditStrategy.OnFieldChange)
 
-    if not model.select():
+    if not query_log.select(model):
         error_message = f"Error selecting data from table: {table_name}, {model.lastError().text()}"
         logger.error(error_message)
         raise RuntimeError(error_message)
 
+    invalidate_heatmap_on_edit(model)
+    invalidate_forecasts_on_edit(model)
     view_widget.setModel(model)
     return model
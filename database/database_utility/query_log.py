@@ -0,0 +1,246 @@
+import atexit
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from PyQt6.QtSql import QSqlDatabase, QSqlDriver, QSqlQuery, QSqlRecord, QSqlTableModel
+import tracker_config as tkc
+from logger_setup import logger, log_directory
+from utility.app_operations.instrumentation import instrumentation
+
+# query_log.py
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_statement(sql: str) -> str:
+    """Collapses the whitespace of a statement, so the same SQL always has the same key."""
+    return " ".join(sql.split())
+
+
+class StatementStats:
+    """Running count, total and maximum duration of one SQL statement."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow = 0
+
+    def record(self, elapsed_ms: float, slow: bool) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.slow += slow
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0,
+            "max_ms": round(self.max_ms, 3),
+            "slow": self.slow,
+        }
+
+
+class QueryLog:
+    """
+    Times SQL statements and logs the slow ones with their query plan.
+
+    Statements run through exec, model selects through select, and the writes of a
+    TimedSqlTableModel through its row methods. Every statement
+    is folded into per-statement stats keyed on its SQL text, and model selects also
+    into the db.select.<table> latency histograms. One that takes at least
+    SLOW_QUERY_MS is logged with its bound values and the output of EXPLAIN QUERY
+    PLAN, so full scans and missing indexes show up in the log along with the values
+    that triggered them. The stats are written to JSON by dump, on demand and at exit.
+    """
+
+    def __init__(self, threshold_ms: float = tkc.SLOW_QUERY_MS) -> None:
+        self.threshold_ms = threshold_ms
+        self.stats: Dict[str, StatementStats] = {}
+        self.lock = threading.Lock()
+        self.started = datetime.datetime.now()
+
+    def exec(self, query: QSqlQuery, sql: Optional[str] = None) -> bool:
+        """
+        Executes a query and times it.
+
+        Args:
+            query (QSqlQuery): The query, already prepared and bound when sql is None.
+            sql (str): A statement to execute directly, as with QSqlQuery.exec(sql).
+
+        Returns:
+            bool: What QSqlQuery.exec returned.
+        """
+        start = time.perf_counter()
+        ok = query.exec() if sql is None else query.exec(sql)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        bind_values = query.boundValues() if sql is None else []
+        self.record(sql if sql is not None else query.lastQuery(), elapsed_ms, bind_values)
+        return ok
+
+    def select(self, model: QSqlTableModel) -> bool:
+        """
+        Runs a table model's select and times it, also into the db.select.<table> histogram.
+
+        Args:
+            model (QSqlTableModel): The model to (re)populate.
+
+        Returns:
+            bool: What QSqlTableModel.select returned.
+        """
+        start = time.perf_counter()
+        ok = model.select()
+        elapsed = time.perf_counter() - start
+        if instrumentation.enabled:
+            instrumentation.record(f"db.select.{model.tableName()}", elapsed)
+        elapsed_ms = elapsed * 1000
+        self.record(model.selectStatement(), elapsed_ms, [])
+        return ok
+
+    def record(self, sql: str, elapsed_ms: float, bind_values: List) -> None:
+        """
+        Adds a timed statement to the stats and logs it if it was slow.
+
+        Args:
+            sql (str): The statement.
+            elapsed_ms (float): How long it took.
+            bind_values (List): The values bound to its placeholders.
+        """
+        statement = normalize_statement(sql)
+        slow = elapsed_ms >= self.threshold_ms
+        with self.lock:
+            stats = self.stats.get(statement)
+            if stats is None:
+                stats = self.stats[statement] = StatementStats()
+            stats.record(elapsed_ms, slow)
+        if slow:
+            logger.error(f"Slow query ({elapsed_ms:.1f} ms): {statement}\n"
+                         f"  bound values: {bind_values}\n"
+                         f"  query plan:\n{self.explain(statement, bind_values)}")
+
+    @staticmethod
+    def explain(statement: str, bind_values: List) -> str:
+        """
+        Returns the EXPLAIN QUERY PLAN of a statement as an indented tree.
+
+        Args:
+            statement (str): The statement.
+            bind_values (List): The values bound to its placeholders.
+
+        Returns:
+            str: One line per plan step, or a note when there is no plan.
+        """
+        try:
+            query = QSqlQuery(QSqlDatabase.database())
+            query.prepare(f"EXPLAIN QUERY PLAN {statement}")
+            for value in bind_values:
+                query.addBindValue(value)
+            if not query.exec():
+                return f"    (no plan: {query.lastError().text()})"
+            depths = {0: 0}
+            lines = []
+            while query.next():
+                depth = depths.get(query.value(1), 0) + 1
+                depths[query.value(0)] = depth
+                lines.append(f"{'  ' * (depth + 1)}{query.value(3)}")
+            return "\n".join(lines) or "    (no plan)"
+        except Exception as e:
+            logger.error(f"Error explaining query: {e}", exc_info=True)
+            return "    (no plan)"
+
+    def summary(self) -> Dict[str, dict]:
+        """Returns the stats of every statement, the most time consuming first."""
+        with self.lock:
+            ranked = sorted(self.stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+            return {statement: stats.to_dict() for statement, stats in ranked}
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Writes the per-statement stats to a JSON file.
+
+        Args:
+            path (str): Where to write, defaults to ~/minder/QUERY_STATS_FILE.
+
+        Returns:
+            Optional[str]: The path written, or None on failure.
+        """
+        path = path or os.path.join(log_directory, tkc.QUERY_STATS_FILE)
+        try:
+            report = {
+                "session_start": self.started.isoformat(timespec="seconds"),
+                "written": datetime.datetime.now().isoformat(timespec="seconds"),
+                "slow_query_ms": self.threshold_ms,
+                "statements": self.summary(),
+            }
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(report, file, indent=2)
+            return path
+        except Exception as e:
+            logger.error(f"Error writing query stats: {e}", exc_info=True)
+            return None
+
+    def dump_at_exit(self) -> None:
+        """Writes the stats at exit if any statement was run."""
+        if self.stats:
+            self.dump()
+
+
+query_log = QueryLog()
+atexit.register(query_log.dump_at_exit)
+
+
+def generated_values(record: QSqlRecord, skip_null: bool = False) -> List:
+    """Returns the values of a record's generated fields, the ones a driver statement binds."""
+    return [record.value(i) for i in range(record.count())
+            if record.isGenerated(i) and not (skip_null and record.isNull(i))]
+
+
+class TimedSqlTableModel(QSqlTableModel):
+    """
+    QSqlTableModel whose own writes are timed by the query log.
+
+    The model writes rows with its own statements, bypassing exec: a DELETE per
+    removed row, an UPDATE per edited cell with the OnFieldChange strategy, and the
+    pending rows of submitAll with the other strategies. Each of them is timed and
+    recorded under the same prepared SQL and bound values the driver runs.
+    """
+
+    def statement(self, statement_type: QSqlDriver.StatementType, record: QSqlRecord) -> str:
+        """Returns the driver's prepared statement of the given type over this model's table."""
+        return self.database().driver().sqlStatement(statement_type, self.tableName(), record, True)
+
+    def where(self, row: int) -> tuple:
+        """Returns the WHERE clause identifying a row and the values bound to it."""
+        primary = self.primaryValues(row)
+        return self.statement(QSqlDriver.StatementType.WhereStatement, primary), \
+            generated_values(primary, skip_null=True)
+
+    def updateRowInTable(self, row: int, values: QSqlRecord) -> bool:
+        where_sql, where_values = self.where(row)
+        start = time.perf_counter()
+        ok = super().updateRowInTable(row, values)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        query_log.record(f"{self.statement(QSqlDriver.StatementType.UpdateStatement, values)} {where_sql}",
+                         elapsed_ms, generated_values(values) + where_values)
+        return ok
+
+    def deleteRowFromTable(self, row: int) -> bool:
+        where_sql, where_values = self.where(row)
+        start = time.perf_counter()
+        ok = super().deleteRowFromTable(row)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        query_log.record(f"{self.statement(QSqlDriver.StatementType.DeleteStatement, QSqlRecord())} {where_sql}",
+                         elapsed_ms, where_values)
+        return ok
+
+    def insertRowIntoTable(self, values: QSqlRecord) -> bool:
+        start = time.perf_counter()
+        ok = super().insertRowIntoTable(values)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        query_log.record(self.statement(QSqlDriver.StatementType.InsertStatement, values),
+                         elapsed_ms, generated_values(values))
+        return ok
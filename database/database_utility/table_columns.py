@@ -0,0 +1,20 @@
+# table_columns.py
+# Column layout of the tracker tables, shared by the analytics helpers.
+
+TABLE_DATE_COLUMNS = {
+    "wefe_table": "wefe_date",
+    "cspr_table": "cspr_date",
+    "mental_mental_table": "mental_mental_date",
+}
+
+TABLE_TIME_COLUMNS = {
+    "wefe_table": "wefe_time",
+    "cspr_table": "cspr_time",
+    "mental_mental_table": "mental_mental_time",
+}
+
+TABLE_SLIDER_COLUMNS = {
+    "wefe_table": ("wellbeing_slider", "excite_slider", "focus_slider", "energy_slider"),
+    "cspr_table": ("calm_slider", "stress_slider", "pain_slider", "rage_slider"),
+    "mental_mental_table": ("mood_slider", "mania_slider", "depression_slider", "mixed_risk_slider"),
+}
@@ -1,6 +1,15 @@
+import atexit
+import datetime
+import glob
+import gzip
 import logging
 import os
+import queue
+import shutil
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 import tracker_config as tkc
 
@@ -18,10 +27,159 @@ if not os.path.exists(log_directory):
 # Path to your log file
 log_file = os.path.join(log_directory, tkc.LOG_FILE)
 
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler over a bounded queue that drops records instead of blocking.
+
+    Records are handed to the listener thread unformatted: the message is resolved
+    so later changes to its arguments can't leak in, but the traceback of exc_info
+    is only formatted by the listener. When the queue is full the record is dropped
+    and counted, and the next record that fits is preceded by a warning with the
+    number of records lost.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0  # records dropped since startup
+        self.unreported = 0  # records dropped since the last warning
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.unreported:
+                self.queue.put_nowait(self.dropped_warning())
+                self.unreported = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self.unreported += 1
+
+    def dropped_warning(self) -> logging.LogRecord:
+        """Returns a record reporting the records dropped since the last report."""
+        return logging.LogRecord(logger.name, logging.WARNING, __file__, 0,
+                                 f"Log queue full, dropped {self.unreported} log records",
+                                 None, None)
+
+
+class BlockingSentinelListener(QueueListener):
+    """QueueListener whose stop() waits for room in a full queue instead of raising."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class LogCompressor(threading.Thread):
+    """
+    Gzips rotated log segments and prunes old ones on a background thread.
+
+    Segments are named <log file>.<timestamp>, so sorting their names sorts them by
+    age. After each compression, compressed segments older than max_age_days are
+    deleted, then the oldest ones until the rest fit in retention_bytes.
+    """
+
+    def __init__(self, base_filename: str, max_age_days: float, retention_bytes: int) -> None:
+        super().__init__(name="log-compressor", daemon=True)
+        self.base_filename = base_filename
+        self.max_age_days = max_age_days
+        self.retention_bytes = retention_bytes
+        self.segments: queue.Queue = queue.Queue()
+
+    def submit(self, segment: str) -> None:
+        """Queues a rotated segment for compression."""
+        self.segments.put(segment)
+
+    def submit_pending(self) -> None:
+        """Queues segments left uncompressed by an earlier session, and prunes."""
+        for segment in sorted(glob.glob(f"{glob.escape(self.base_filename)}.*")):
+            if not segment.endswith(".gz"):
+                self.submit(segment)
+        self.segments.put("")  # prune even when nothing is pending
+
+    def stop(self) -> None:
+        """Finishes the queued work and stops the thread."""
+        self.segments.put(None)
+        self.join(timeout=10)
+
+    def run(self) -> None:
+        while True:
+            segment = self.segments.get()
+            if segment is None:
+                return
+            try:
+                if segment:
+                    self.compress(segment)
+                self.prune()
+            except Exception as e:
+                # Logging from here could end up back in this thread's queue
+                print(f"Error compressing log segment {segment}: {e}", file=sys.stderr)
+
+    @staticmethod
+    def compress(segment: str) -> None:
+        """Gzips segment next to itself and removes the original."""
+        with open(segment, 'rb') as source, gzip.open(f"{segment}.gz", 'wb', compresslevel=6) as target:
+            shutil.copyfileobj(source, target)
+        os.remove(segment)
+
+    def prune(self) -> None:
+        """Deletes compressed segments past the age limit or the retention budget."""
+        oldest_allowed = time.time() - self.max_age_days * 24 * 60 * 60
+        kept_bytes = 0
+        for segment in sorted(glob.glob(f"{glob.escape(self.base_filename)}.*.gz"), reverse=True):
+            size = os.path.getsize(segment)
+            if os.path.getmtime(segment) < oldest_allowed or kept_bytes + size > self.retention_bytes:
+                os.remove(segment)
+            else:
+                kept_bytes += size
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    Appends to the log file and rotates it into a timestamped segment once it
+    reaches max_bytes. Rotated segments are compressed and pruned by a
+    LogCompressor, so rotation never waits on gzip.
+    """
+
+    def __init__(self, filename: str, mode: str, max_bytes: int, max_age_days: float,
+                 retention_bytes: int) -> None:
+        super().__init__(filename, mode=mode, maxBytes=max_bytes, encoding='utf-8')
+        self.compressor = LogCompressor(self.baseFilename, max_age_days, retention_bytes)
+        self.compressor.start()
+        self.compressor.submit_pending()
+        atexit.register(self.compressor.stop)
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            segment = f"{self.baseFilename}.{datetime.datetime.now():%Y%m%d-%H%M%S-%f}"
+            os.replace(self.baseFilename, segment)
+            self.compressor.submit(segment)
+        if not self.delay:
+            self.stream = self._open()
+
+
+file_handler = CompressingRotatingFileHandler(log_file, mode=tkc.FILE_MODE,
+                                              max_bytes=tkc.LOG_MAX_BYTES,
+                                              max_age_days=tkc.LOG_MAX_AGE_DAYS,
+                                              retention_bytes=tkc.LOG_RETENTION_BYTES)
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
+                                            datefmt=tkc.DATEFORMAT))
+
+log_queue: queue.Queue = queue.Queue(maxsize=tkc.LOG_QUEUE_SIZE)
+queue_handler = DroppingQueueHandler(log_queue)
+
+# The listener thread does the formatting and the file writes
+log_listener = BlockingSentinelListener(log_queue, file_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 logging.basicConfig(level=logging.ERROR,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt=tkc.DATEFORMAT,
-                    filename=log_file,
-                    filemode=tkc.FILE_MODE)
+                    handlers=[queue_handler])
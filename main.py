@@ -1,10 +1,9 @@
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from PyQt6 import QtGui
-from ui.main_window import MainWindow
+import importlib
 import sys, os
+import tracker_config as tkc
 from logger_setup import logger
-from ui.main_ui import res
+from utility.app_operations.startup_profiler import startup_profiler
+from utility.app_operations.memory_profiler import memory_profiler
 basedir = os.path.dirname(__file__)
 
 
@@ -16,24 +15,104 @@ except ImportError:
     pass
 
 
-def run_app():
+def provision_database():
+    """
+        Provisions the database before the main window is built.
+
+        Runs before MainWindow, so no half-built window can receive input while a
+        large seed is copied. The copy runs on a DatabaseProvisioner thread while a
+        local event loop keeps the app responsive, and its progress goes to a splash
+        screen, shown only if there is something to copy.
+
+    """
+    from PyQt6.QtCore import QEventLoop
+    from PyQt6.QtGui import QPixmap
+    from PyQt6.QtWidgets import QSplashScreen
+    from database.database_manager import DatabaseProvisioner, database_provisioned
+    if database_provisioned():
+        return
+    splash = None
+
+    def show_progress(remaining: int, total: int) -> None:
+        nonlocal splash
+        done = 100 * (total - remaining) // max(total, 1)
+        if splash is not None:
+            splash.showMessage(f"Setting up the database... {done}%")
+            return
+        pixmap = QPixmap(*tkc.SPLASH_SIZE)
+        pixmap.fill()
+        splash = QSplashScreen(pixmap)
+        splash.showMessage(f"Setting up the database... {done}%")
+        # Showing the splash can deliver the progress queued meanwhile, so it comes last
+        splash.show()
+
+    loop = QEventLoop()
+    provisioner = DatabaseProvisioner()
+    provisioner.progress.connect(show_progress)
+    provisioner.finished.connect(loop.quit)
+    provisioner.start()
+    loop.exec()
+    provisioner.wait()
+    if splash is not None:
+        splash.close()
+
+
+def run_app(argv=None):
     """
         Runs the application.
 
         This function initializes the application, creates the main window,
         and starts the event loop.
 
+        The heavy imports happen here rather than at module level, so that
+        --profile-startup can time them and --profile-memory can trace them. See
+        StartupProfiler.configure and MemoryProfiler.configure for the profiling options.
+
+        Args:
+            argv: The command line, defaults to sys.argv.
+
         Raises:
             Exception: If an error occurs during the execution of the application.
 
     """
+    argv = startup_profiler.configure(sys.argv if argv is None else argv)
+    argv = memory_profiler.configure(argv)
     logger.info("ENTER BY PORTAL START YES!")
     try:
-        app = QApplication(sys.argv)
-        app.setWindowIcon(QtGui.QIcon(os.path.join(basedir, 'procto.icns')))
-        window = MainWindow()
-        window.show()
-        sys.exit(app.exec())
+        for module in ("PyQt6.QtCore", "PyQt6.QtGui", "PyQt6.QtWidgets", "PyQt6.QtSql"):
+            with startup_profiler.phase(f"import {module}"):
+                importlib.import_module(module)
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6 import QtGui
+        with startup_profiler.phase("import ui.main_ui.gui"):
+            import ui.main_ui.gui
+        with startup_profiler.phase("import ui.main_window"):
+            from ui.main_window import MainWindow
+        with startup_profiler.phase("register_resources"):
+            from utility.app_operations.resource_loader import register_resources
+            register_resources()
+        with startup_profiler.phase("QApplication"):
+            app = QApplication(argv)
+            app.setWindowIcon(QtGui.QIcon(os.path.join(basedir, 'procto.icns')))
+        with startup_profiler.phase("apply_stylesheet"):
+            from utility.app_operations.stylesheet_loader import apply_stylesheet
+            apply_stylesheet(app)
+        with startup_profiler.phase("provision_database"):
+            provision_database()
+        watchdog = None
+        if tkc.STALL_WATCHDOG_ENABLED:
+            from utility.app_operations.stall_watchdog import StallWatchdog
+            watchdog = StallWatchdog(parent=app)
+            watchdog.start()
+        with startup_profiler.phase("MainWindow"):
+            window = MainWindow()
+        memory_profiler.checkpoint("main_window")
+        with startup_profiler.phase("show"):
+            window.show()
+        exit_code = app.exec()
+        if watchdog is not None:
+            watchdog.stop()
+        sys.exit(exit_code)
     except Exception as e:
         logger.error(f"Error at portal {e}", exc_info=True)
     
@@ -1,7 +1,28 @@
 # from sexy_logger import logger
 from logger_setup import logger
+from utility.app_operations.instrumentation import measure
 from typing import Any
 
+# mainStack page indices
+MMDM_PAGE = 0
+WEFE_PAGE = 1
+CSPR_PAGE = 2
+MMDM_TABLE_PAGE = 3
+WEFE_TABLE_PAGE = 4
+CSPR_TABLE_PAGE = 5
+DIAGNOSTICS_PAGE = 7
+
+# The fixed window size of each page, as (width, height)
+PAGE_SIZES = {
+    MMDM_PAGE: (320, 390),
+    WEFE_PAGE: (320, 390),
+    CSPR_PAGE: (320, 390),
+    MMDM_TABLE_PAGE: (800, 460),
+    WEFE_TABLE_PAGE: (800, 460),
+    CSPR_TABLE_PAGE: (800, 460),
+    DIAGNOSTICS_PAGE: (460, 520),
+}
+
 
 def change_mainStack(mainStack: Any, index: int) -> None:
     """
@@ -15,7 +36,8 @@ def change_mainStack(mainStack: Any, index: int) -> None:
     None
     """
     try:
-        mainStack.setCurrentIndex(index)
+        with measure(f"ui.page_switch.{index}"):
+            mainStack.setCurrentIndex(index)
     except Exception as e:
         logger.error(f"main stack Page Change Error: {e}", exc_info=True)
 
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# The widgets are tested headless, and the app's modules are imported from the repository root
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication the widget tests run in."""
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
@@ -0,0 +1,27 @@
+import os
+import statistics
+import sys
+
+import pytest
+
+import tracker_config as tkc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+from import_budget import measure_import  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def imports(tmp_path_factory):
+    """Cold imports of ui.main_window, each in a fresh interpreter."""
+    home = str(tmp_path_factory.mktemp("home"))
+    return [measure_import("ui.main_window", home) for _ in range(tkc.IMPORT_BUDGET_RUNS)]
+
+
+def test_median_import_time_is_within_budget(imports):
+    median_ms = statistics.median(result["elapsed_ms"] for result in imports)
+    assert median_ms <= tkc.IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize("module", tkc.IMPORT_BUDGET_DEFERRED)
+def test_deferred_module_is_not_imported(imports, module):
+    assert all(module not in result["modules"] for result in imports)
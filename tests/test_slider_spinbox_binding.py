@@ -0,0 +1,94 @@
+import pytest
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QSlider, QSpinBox
+
+from utility.widgets_set_widgets.slider_spinbox_connections import (
+    SliderSpinBinding, connect_slider_spinbox)
+
+STEPS = 10
+
+
+@pytest.fixture
+def pair(qapp):
+    """A slider with STEPS steps bound to a wider spinbox, with the emissions of all three recorded."""
+    slider = QSlider(Qt.Orientation.Horizontal)
+    slider.setRange(0, STEPS)
+    slider.resize(200, 20)
+    spinbox = QSpinBox()
+    spinbox.setRange(0, 99)
+    binding = connect_slider_spinbox(slider, spinbox)
+    emitted = {"slider": [], "spinbox": [], "binding": []}
+    slider.valueChanged.connect(emitted["slider"].append)
+    spinbox.valueChanged.connect(emitted["spinbox"].append)
+    binding.valueChanged.connect(emitted["binding"].append)
+    slider.show()
+    QTest.qWaitForWindowExposed(slider)
+    yield slider, spinbox, binding, emitted
+    slider.close()
+
+
+def drag(slider: QSlider, start_x: int, end_x: int, step: int = 4) -> None:
+    """Drags the slider's handle from start_x to end_x with the mouse."""
+    y = slider.height() // 2
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=QPoint(start_x, y))
+    for x in range(start_x, end_x, step if end_x > start_x else -step):
+        QTest.mouseMove(slider, QPoint(x, y))
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=QPoint(end_x, y))
+
+
+def test_connect_returns_binding(pair):
+    slider, spinbox, binding, _ = pair
+    assert isinstance(binding, SliderSpinBinding)
+    assert binding.value() == slider.value() == spinbox.value() == 0
+
+
+def test_connect_rejects_non_widgets(qapp):
+    assert connect_slider_spinbox(QSlider(), None) is None
+
+
+def test_drag_emits_once_per_step(pair):
+    slider, spinbox, binding, emitted = pair
+    drag(slider, 2, slider.width() - 2)
+
+    assert slider.value() == spinbox.value() == binding.value() == STEPS
+    assert emitted["binding"] == list(range(1, STEPS + 1))
+    # The slider changed once per step and the spinbox, updated under a signal blocker, never echoed
+    assert len(emitted["slider"]) == STEPS
+    assert emitted["spinbox"] == []
+
+
+def test_drag_back_emits_once_per_step(pair):
+    slider, spinbox, binding, emitted = pair
+    drag(slider, 2, slider.width() - 2)
+    emitted["binding"].clear()
+    drag(slider, slider.width() - 2, 2)
+
+    assert binding.value() == spinbox.value() == 0
+    assert emitted["binding"] == list(range(STEPS - 1, -1, -1))
+    assert emitted["spinbox"] == []
+
+
+def test_spinbox_edit_emits_once(pair):
+    slider, spinbox, binding, emitted = pair
+    spinbox.setValue(4)
+
+    assert slider.value() == binding.value() == 4
+    assert emitted["binding"] == [4]
+    assert emitted["spinbox"] == [4]
+    assert emitted["slider"] == []
+
+
+def test_unchanged_value_emits_nothing(pair):
+    slider, spinbox, binding, emitted = pair
+    binding.setValue(0)
+
+    assert emitted == {"slider": [], "spinbox": [], "binding": []}
+
+
+def test_spinbox_value_is_clamped_to_slider_range(pair):
+    slider, spinbox, binding, emitted = pair
+    spinbox.setValue(42)
+
+    assert slider.value() == spinbox.value() == binding.value() == STEPS
+    assert emitted["binding"] == [STEPS]
@@ -7,10 +7,49 @@ APPLICATION_NAME = "minder"
 LOG_FILE = 'minder.log'
 PRINGLES = 'minder'  # lol the directory made/placed
 DATEFORMAT = '%d-%b-%y %I:%M:%S %p'  # this is how you want it from now on lolol ok?
-FILE_MODE = 'w'
+FILE_MODE = 'a'
+LOG_MAX_BYTES = 1024 * 1024  # size at which minder.log is rotated into a gzipped segment
+LOG_MAX_AGE_DAYS = 28  # rotated segments older than this are deleted
+LOG_RETENTION_BYTES = 16 * 1024 * 1024  # disk budget of the gzipped segments, oldest go first
+LOG_QUEUE_SIZE = 1000  # records waiting for the log writer thread before new ones are dropped
 # database
 DB_NAME = 'the_one_and_only_babababy_june17.db'
+DB_PROVISION_PAGES_PER_STEP = 1024  # pages copied per backup step when seeding the database
+SPLASH_SIZE = (320, 80)  # splash screen shown while the database is seeded on first launch
 
 
 
 
+# anomaly flags
+ANOMALY_EWMA_ALPHA = 0.1  # weight of the newest entry in the running mean/variance
+ANOMALY_Z_THRESHOLD = 3.0  # standard deviations from the running mean that get flagged
+ANOMALY_WARMUP_SAMPLES = 10  # entries a slider needs before its values are flagged
+# analytics result cache
+RESULT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # memory budget of cached analytic results
+# startup profiling (run with --profile-startup)
+STARTUP_PROFILE_FILE = 'startup_profile.json'
+STARTUP_CPROFILE_FILE = 'startup_profile.prof'
+# memory profiling (run with --profile-memory)
+MEMORY_PROFILE_FILE = 'memory_profile.json'
+MEMORY_PROFILE_FRAMES = 1  # frames kept per traced allocation, more costs memory and time
+MEMORY_PROFILE_TOP = 15  # allocators listed per checkpoint
+# latency instrumentation
+INSTRUMENTATION_ENABLED = True  # time inserts, model setup, deletes and page switches
+LATENCY_HISTOGRAM_FILE = 'latency_histograms.json'  # written to ~/minder at exit
+DIAGNOSTICS_REFRESH_MS = 2000  # refresh interval of the diagnostics page counters
+# frameless window
+WINDOW_CORNER_RADIUS = 10.0  # radius of the window's rounded corners
+WINDOW_MASK_CACHE_SIZE = 32  # rounded window masks kept, one per window size
+# derived values, e.g. the WEFE summary
+DERIVED_VALUE_DELAY_MS = 16  # recomputes are throttled to one per this interval, one 60 Hz frame
+# slow-query log
+SLOW_QUERY_MS = 50  # statements at least this slow are logged with their query plan
+QUERY_STATS_FILE = 'query_stats.json'  # per-statement stats, written to ~/minder at exit
+# event-loop stall watchdog
+STALL_WATCHDOG_ENABLED = True  # log the main thread's stack when the event loop freezes
+STALL_HEARTBEAT_MS = 100  # interval of the main thread's heartbeat timer
+STALL_THRESHOLD_MS = 1000  # heartbeat silence that counts as a stall
+# import budget (benchmarks/import_budget.py)
+IMPORT_BUDGET_MS = 150  # median cold import time allowed for ui.main_window
+IMPORT_BUDGET_RUNS = 7  # fresh interpreters the median is taken over
+IMPORT_BUDGET_DEFERRED = ('PyQt6.QtPrintSupport',)  # modules that must not load with the window
@@ -1,9 +1,8 @@
 import datetime
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime
-from PyQt6.QtGui import QCloseEvent
+from PyQt6.QtCore import QDate, QSettings, QTime, QTimer, Qt, QByteArray, QDateTime, QSize
+from PyQt6.QtGui import QCloseEvent, QPaintEvent, QShowEvent
 from PyQt6.QtWidgets import QApplication, QTextEdit, QPushButton, QDialog, QFormLayout, QLineEdit
-from PyQt6.QtPrintSupport import QPrintDialog
 
 import tracker_config as tkc
 
@@ -15,20 +14,24 @@ from ui.main_ui.gui import Ui_MainWindow
 # LOGGER
 #############################################################################
 from logger_setup import logger
+from utility.app_operations.startup_profiler import startup_profiler
+from utility.app_operations.instrumentation import measure
 
 #############################################################################
 # NAVIGATION
 #############################################################################
-from navigation.master_navigation import change_mainStack
+from navigation.master_navigation import (
+    change_mainStack, MMDM_PAGE, WEFE_PAGE, CSPR_PAGE, MMDM_TABLE_PAGE, WEFE_TABLE_PAGE,
+    CSPR_TABLE_PAGE, DIAGNOSTICS_PAGE, PAGE_SIZES)
 #############################################################################
 # UTILITY
 #############################################################################
 from utility.app_operations.diet_calc import (
     calculate_calories)
-from utility.app_operations.save_generic import (
-    TextEditSaver)
 from utility.widgets_set_widgets.slider_spinbox_connections import (
     connect_slider_spinbox)
+from utility.widgets_set_widgets.derived_value import (
+    ThrottledDerivedValue)
 
 # Window geometry and frame
 from utility.app_operations.frameless_window import (
@@ -47,6 +50,10 @@ from utility.widgets_set_widgets.buttons_set_time import (
 
 from utility.app_operations.show_hide import (
     toggle_views)
+from utility.app_operations.lazy_pages import (
+    LazyPageLoader)
+from utility.app_operations.diagnostics import (
+    DiagnosticsPanel)
 
 from utility.widgets_set_widgets.buttons_set_time import (
     btn_times)
@@ -77,52 +84,39 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
     and operations related to the application.
 
     Attributes:
-    - exercise_model: The exercise model.
-    - tooth_model: The tooth model.
-    - shower_model: The shower model.
-    - hydro_model: The hydro model.
-    - diet_model: The diet model.
-    - lily_walk_note_model: The lily walk note model.
-    - lily_note_model: The lily note model.
-    - lily_room_model: The lily room model.
-    - lily_walk_model: The lily walk model.
-    - lily_mood_model: The lily mood model.
-    - lily_diet_model: The lily diet model.
-    - mental_mental_model: The mental mental model.
-    - cspr_model: The cspr model.
-    - wefe_model: The wefe model.
-    - btn_times: The button times.
-    - sleep_quality_model: The sleep quality model.
-    - woke_up_like_model: The woke up like model.
-    - sleep_model: The sleep model.
-    - total_hours_slept_model: The total hours slept model.
-    - total_hrs_slept: The total hours slept.
-    - basics_model: The basics model.
+    - mental_mental_model: The mental mental model, once its table view page is built.
+    - cspr_model: The cspr model, once its table view page is built.
+    - wefe_model: The wefe model, once its table view page is built.
+    - diagnostics_panel: The DiagnosticsPanel, once the diagnostics page is built.
+    - startup_models: The models of the pages built at startup, loaded once the window is shown.
+    - beck_summary: The ThrottledDerivedValue behind the WEFE summing box.
     - ui: The UI object.
     - db_manager: The database manager.
     - settings: The QSettings object.
+    - page_loader: The LazyPageLoader that builds mainStack pages on first show.
     - window_controller: The WindowController object.
 
     Methods:
     - __init__: Initializes the MainWindow object.
+    - build_mmdm_page, build_wefe_page, build_cspr_page: Build the input pages.
+    - build_mmdm_tableview, build_wefe_tableview, build_cspr_tableview: Build the table view pages.
+    - build_diagnostics_page: Builds the diagnostics page.
+    - toggle_diagnostics: Starts or stops the diagnostics counters with their page.
     - commits_setup: Sets up the commits.
+    - app_operations: Performs various operations related to the application.
     - slider_set_spinbox: Connects sliders to spinboxes.
     - update_time: Updates the time displayed on the time_label widget.
     - update_beck_summary: Updates the averages of the sliders in the wellbeing and pain module.
-    - init_hydration_tracker: Initializes the hydration tracker buttons.
-    - switch_to_mmdm_page: Switches to the bds page.
-    - switch_to_wefe_page: Switches to the sleep data page.
-    - switch_to_cspr_page: Switches to the diet data page.
-    - switch_to_basics_data_page: Switches to the basics data page.
-    - switch_to_mmdm_measures: Switches to the mmdm measures page.
-    - switch_to_wefe_measures: Switches to the wefe measures page.
-    - cspr_measures: Switches to the cspr measures page.
-    - mmwefecspr_datapage: Switches to the mmwefecspr datapage.
-    - switch_lilys_mod: Switches to the lilys mod page.
-    - switch_to_lilys_dataviews: Switches to the lilys dataviews page.
+    - show_page: Switches to a page and fixes the window to the page's size.
     - auto_date_setters: Automatically sets the date for various widgets.
     - auto_time_setters: Automatically sets the time for various widgets.
-    - app_operations: Performs various operations related to the application.
+    - on_page_changed: Remembers the current page.
+    - stack_navigation: Connects the view actions to show_page.
+    - mental_mental_table_commit, cspr_commit, wefe_commit: Connect the commit actions.
+    - delete_actions: Connects the delete action for each table.
+    - load_model, load_startup_models: Load the model of a table view page, at once or after the first show.
+    - setup_model: Creates the model of a table view.
+    - save_state, restore_state: Save and restore the window geometry.
     """
     def __init__(self,
                  *args,
@@ -131,35 +125,136 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         self.mental_mental_model = None
         self.cspr_model = None
         self.wefe_model = None
-        self.ui = Ui_MainWindow()
-        self.setupUi(self)
-        # Database init
-        self.db_manager = DataManager()
-        self.setup_models()
+        self.diagnostics_panel = None
+        self.beck_summary = None
+        self.startup_models = []
         # QSettings settings_manager setup
         self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+        last_index = self.settings.value("lastPageIndex", 0, type=int)
+        self.ui = Ui_MainWindow()
+        with startup_profiler.phase("setupUi"):
+            self.setupUi(self)
+        # Database init
+        with startup_profiler.phase("DataManager"):
+            self.db_manager = DataManager()
+        # Pages are built the first time they are shown, starting with the restored one.
+        # Its model is queued in startup_models and loaded right after the first show.
+        self.page_loader = LazyPageLoader(self.mainStack, {
+            MMDM_PAGE: self.build_mmdm_page,
+            WEFE_PAGE: self.build_wefe_page,
+            CSPR_PAGE: self.build_cspr_page,
+            MMDM_TABLE_PAGE: self.build_mmdm_tableview,
+            WEFE_TABLE_PAGE: self.build_wefe_tableview,
+            CSPR_TABLE_PAGE: self.build_cspr_tableview,
+            DIAGNOSTICS_PAGE: self.build_diagnostics_page,
+        })
+        with startup_profiler.phase("build_start_page"):
+            self.page_loader.ensure_built(last_index)
         self.window_controller = WindowController()
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self.restore_state()
+        with startup_profiler.phase("restore_state"):
+            self.restore_state()
         self.app_operations()
         self.auto_date_setters()
         self.stack_navigation()
         self.delete_actions()
-        self.switch_page_view_setup()
         self.commits_setup()
-        self.update_beck_summary()
         self.auto_time_setters()
-        
-        self.summing_box.setEnabled(False)
+
+    ##########################################################################################
+    # PAGE builders, run by the page_loader the first time a page is needed
+    ##########################################################################################
+    def build_mmdm_page(self) -> None:
+        """
+        Builds the MMDM input page and connects its sliders to their spinboxes.
+        """
+        self.setupMmdmPage()
+        self.slider_set_spinbox({
+            self.mood_slider: self.mood,
+            self.mania_slider: self.mania,
+            self.depression_slider: self.depression,
+            self.mixed_risk_slider: self.mixed_risk,
+        })
+
+    def build_wefe_page(self) -> None:
+        """
+        Builds the WEFE input page and hooks its sliders up to the summing box.
+
+        The summing box lives on the WEFE table view page, which is built first. Its
+        sum is recomputed at most once per frame while the sliders move.
+        """
+        self.page_loader.ensure_built(WEFE_TABLE_PAGE)
+        self.setupWefePage()
+        bindings = self.slider_set_spinbox({
+            self.wellbeing_slider: self.wellbeing_spinbox,
+            self.excite_slider: self.excite_spinbox,
+            self.focus_slider: self.focus_spinbox,
+            self.energy_slider: self.energy_spinbox,
+        })
         for slider in [self.wellbeing_slider, self.excite_slider, self.focus_slider,
                        self.energy_slider]:
             slider.setRange(0, 10)
-        
-        self.wellbeing_slider.valueChanged.connect(self.update_beck_summary)
-        self.excite_slider.valueChanged.connect(self.update_beck_summary)
-        self.focus_slider.valueChanged.connect(self.update_beck_summary)
-        self.energy_slider.valueChanged.connect(self.update_beck_summary)
-    
+
+        self.beck_summary = ThrottledDerivedValue(self.update_beck_summary, self)
+        self.beck_summary.watch(*(binding.valueChanged for binding in bindings))
+        self.update_beck_summary()
+
+    def build_cspr_page(self) -> None:
+        """
+        Builds the CSPR input page and connects its sliders to their spinboxes.
+        """
+        self.setupCsprPage()
+        self.slider_set_spinbox({
+            self.calm_slider: self.calm_spinbox,
+            self.stress_slider: self.stress_spinbox,
+            self.rage_slider: self.rage_spinbox,
+            self.pain_slider: self.pain_spinbox,
+        })
+
+    def build_mmdm_tableview(self) -> None:
+        """
+        Builds the MMDM table view page and loads its model.
+        """
+        self.setupMmdmDataPage()
+        self.load_model("mental_mental_model", "mental_mental_table", self.mental_mental_table)
+
+    def build_wefe_tableview(self) -> None:
+        """
+        Builds the WEFE table view page and loads its model.
+        """
+        self.setupWefeDataPage()
+        self.summing_box.setEnabled(False)
+        self.load_model("wefe_model", "wefe_table", self.wefe_tableview)
+
+    def build_cspr_tableview(self) -> None:
+        """
+        Builds the CSPR table view page and loads its model.
+        """
+        self.setupCsprDataPage()
+        self.load_model("cspr_model", "cspr_table", self.cspr_tableview)
+
+    def build_diagnostics_page(self) -> None:
+        """
+        Builds the diagnostics page, whose counters only refresh while it is shown.
+        """
+        layout = QtWidgets.QVBoxLayout(self.diagnostics_page)
+        self.diagnostics_panel = DiagnosticsPanel(self.diagnostics_page)
+        layout.addWidget(self.diagnostics_panel)
+        self.mainStack.currentChanged.connect(self.toggle_diagnostics)
+        self.toggle_diagnostics(self.mainStack.currentIndex())
+
+    def toggle_diagnostics(self, index: int) -> None:
+        """
+        Starts the diagnostics counters when their page is shown and stops them when it's left.
+
+        Args:
+            index (int): The index of the current page.
+        """
+        if index == DIAGNOSTICS_PAGE:
+            self.diagnostics_panel.start()
+        else:
+            self.diagnostics_panel.stop()
+
     def commits_setup(self):        
         """
         Sets up the necessary commits for the main window.
@@ -184,22 +279,21 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
 
         This method connects the currentChanged signal of the mainStack to the on_page_changed slot,
         hides the check frame, connects the triggered signal of the actionTotalHours to the
-        calculate_total_hours_slept slot, and sets the current index of the mainStack based on the
-        last saved index.
+        calculate_total_hours_slept slot, and shows the last saved page at its size.
 
         Raises:
             Exception: If an error occurs while setting up the app_operations.
 
         """
         try:
-            self.slider_set_spinbox()
             self.mainStack.currentChanged.connect(self.on_page_changed)
             last_index = self.settings.value("lastPageIndex", 0, type=int)
-            self.mainStack.setCurrentIndex(last_index)
+            self.show_page(last_index)
         except Exception as e:
             logger.error(f"Error occurred while setting up app_operations : {e}", exc_info=True)
             
-    def slider_set_spinbox(self):
+    @staticmethod
+    def slider_set_spinbox(connect_slider_to_spinbox: dict) -> list:
         """
         Connects sliders to their corresponding spinboxes.
 
@@ -207,26 +301,16 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         by mapping each slider to its corresponding spinbox. It then calls
         the `connect_slider_spinbox` function to establish the connection.
 
+        Args:
+            connect_slider_to_spinbox (dict): Maps each slider of a page to its spinbox.
+
         Returns:
-            None
+            list: The SliderSpinBinding of each pair, whose valueChanged fires once per edit.
+                Pairs that connect_slider_spinbox couldn't bind are left out.
         """
-        connect_slider_to_spinbox = {
-            self.wellbeing_slider: self.wellbeing_spinbox,
-            self.excite_slider: self.excite_spinbox,
-            self.focus_slider: self.focus_spinbox,
-            self.energy_slider: self.energy_spinbox,
-            self.mood_slider: self.mood,
-            self.mania_slider: self.mania,
-            self.depression_slider: self.depression,
-            self.mixed_risk_slider: self.mixed_risk,
-            self.calm_slider: self.calm_spinbox,
-            self.stress_slider: self.stress_spinbox,
-            self.rage_slider: self.rage_spinbox,
-            self.pain_slider: self.pain_spinbox,
-        }
-        
-        for slider, spinbox in connect_slider_to_spinbox.items():
-            connect_slider_spinbox(slider, spinbox)
+        bindings = [connect_slider_spinbox(slider, spinbox)
+                    for slider, spinbox in connect_slider_to_spinbox.items()]
+        return [binding for binding in bindings if binding is not None]
 
     @staticmethod
     def update_time(state, time_label):
@@ -258,108 +342,48 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         :return: None
         """
         try:
-            values = [slider.value() for slider in
-                      [self.wellbeing_slider, self.excite_slider, self.focus_slider,
-                       self.energy_slider] if
-                      slider.value() > 0]
+            with measure("ui.update_beck_summary"):
+                values = [slider.value() for slider in
+                          [self.wellbeing_slider, self.excite_slider, self.focus_slider,
+                           self.energy_slider] if
+                          slider.value() > 0]
 
-            s = sum(values)
+                s = sum(values)
 
-            self.summing_box.setValue(int(s))
+                self.summing_box.setValue(int(s))
 
         except Exception as e:
             logger.error(f"{e}", exc_info=True)
             
-    def switch_to_mmdm_page(self):
-        """
-        Switches to the MMDM page in the main window.
-
-        This method sets the current widget of the mainStack to the MMDM page,
-        and resizes the main window to a fixed size of 320x390 pixels.
+    def show_page(self, index: int) -> None:
         """
-        try:
-            self.mainStack.setCurrentWidget(self.mmdm_page)
-            self.setFixedSize(320, 390)
-        except Exception as e:
-            logger.error(f"{e}", exc_info=True)
+        Switches the mainStack to a page and fixes the window to the page's size.
 
-    def switch_to_wefe_page(self):
-        """
-        Switches to the WEFE page in the main window.
+        The switch and the resize happen with updates disabled, so the window is laid
+        out and repainted once. The size is only set when it differs from the current
+        fixed size, since setFixedSize relayouts the window even when nothing changed.
 
-        This method sets the current widget of the mainStack to the wefe_page,
-        and resizes the main window to a fixed size of 320x390.
-        """
-        try:
-            self.mainStack.setCurrentWidget(self.wefe_page)
-            self.setFixedSize(320, 390)
-        except Exception as e:
-            logger.error(f"{e}", exc_info=True)
-            
-    def switch_to_cspr_page(self):
-        """
-        Switches to the CSPR page and sets the fixed size of the main window.
-
-        Returns:
-            None
-        """
-        try:
-            self.mainStack.setCurrentWidget(self.cspr_page)
-            self.setFixedSize(320, 390)
-        except Exception as e:
-            logger.error(f"{e}", exc_info=True)
-    
-    def switch_to_mmdm_tableview(self):
-        """
-        Switches to the MMDM table view in the main window.
-
-        This method sets the current widget of the mainStack to the mmdm_data_page,
-        and fixes the size of the main window to 800x460.
-
-        Parameters:
-            None
+        Args:
+            index (int): The index of the page to show.
 
         Returns:
             None
         """
         try:
-            self.mainStack.setCurrentWidget(self.mmdm_data_page)
-            self.setFixedSize(800, 460)
+            size = QSize(*PAGE_SIZES[index]) if index in PAGE_SIZES else None
+            resize = size is not None and not (self.minimumSize() == size == self.maximumSize())
+            if index == self.mainStack.currentIndex() and not resize:
+                return
+            self.setUpdatesEnabled(False)
+            try:
+                change_mainStack(self.mainStack, index)
+                if resize:
+                    self.setFixedSize(size)
+            finally:
+                self.setUpdatesEnabled(True)
         except Exception as e:
-            logger.error(f"{e}", exc_info=True)
-            
-    def switch_to_wefe_tableview(self):
-        """
-        Switches to the WEFE table view in the main window.
+            logger.error(f"Error showing page {index}: {e}", exc_info=True)
 
-        This method sets the current widget of the mainStack to the wefe_data_page,
-        and fixes the size of the main window to 800x460.
-        """
-        try:    
-            self.mainStack.setCurrentWidget(self.wefe_data_page)
-            self.setFixedSize(800, 460)
-        except Exception as e:
-            logger.error(f"{e}", exc_info=True)
-            
-    def switch_to_cspr_tableview(self):
-        """
-        Switches to the CSPR table view in the main window.
-
-        This method sets the current widget of the mainStack to the cspr_data_page,
-        and fixes the size of the main window to 800x460.
-
-        Parameters:
-            None
-
-        Returns:
-            None
-        """
-        try:
-            self.mainStack.setCurrentWidget(self.cspr_data_page)
-            self.setFixedSize(800, 460)
-        except Exception as e:
-            logger.error(f"{e}", exc_info=True)
-            
     def auto_date_setters(self) -> None:
         """
         Sets the date for various widgets to the current date.
@@ -428,31 +452,16 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                 self.actionMMDMInputView: 0, self.actionWEFEInputView: 1,
                 self.actionCSPRInputView: 2, self.actionMMDMTableView: 3,
                 self.actionWEFETableView: 4, self.actionCSPRTableView: 5,
+                self.actionDiagnosticsView: DIAGNOSTICS_PAGE,
             }
             
             # Main Stack Navigation
             for action, page in mainStackNavvy.items():
-                action.triggered.connect(
-                    lambda _, p=page: change_mainStack(self.mainStack, p))
+                action.triggered.connect(lambda _, p=page: self.show_page(p))
         
         except Exception as e:
             logger.error(f"An error has occurred: {e}", exc_info=True)
     
-    def switch_page_view_setup(self):
-        """
-        Connects the various actions to their corresponding methods for switching pages/views.
-
-        This method sets up the connections between the menu actions and the methods that handle
-        switching to different pages/views in the application.
-
-        """
-        self.actionMMDMInputView.triggered.connect(self.switch_to_mmdm_page)
-        self.actionWEFEInputView.triggered.connect(self.switch_to_wefe_page)
-        self.actionCSPRInputView.triggered.connect(self.switch_to_cspr_page)
-        self.actionMMDMTableView.triggered.connect(self.switch_to_mmdm_tableview)
-        self.actionWEFETableView.triggered.connect(self.switch_to_wefe_tableview)
-        self.actionCSPRTableView.triggered.connect(self.switch_to_cspr_tableview)
-    
     def mental_mental_table_commit(self) -> None:
         """
         Connects the 'commit' action to the 'add_mentalsolo_data' function and inserts data into the mental_mental_table.
@@ -463,8 +472,8 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             Exception: If an error occurs during the process.
         """
         try:
-            self.actionCommitMDMr.triggered.connect(
-                lambda: add_mentalsolo_data(
+            self.actionCommitMDMr.triggered.connect(self.page_loader.after_building(
+                MMDM_PAGE, lambda: add_mentalsolo_data(
                     self, {
                         "mental_mental_date": "mental_mental_date",
                         "mental_mental_time": "mental_mental_time",
@@ -474,7 +483,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                         "mixed_risk_slider": "mixed_risk_slider",
                         "model": "mental_mental_model"
                     },
-                    self.db_manager.insert_into_mental_mental_table, ))
+                    self.db_manager.insert_into_mental_mental_table, )))
         except Exception as e:
             logger.error(f"An Error has occurred {e}", exc_info=True)
     
@@ -486,8 +495,8 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             Exception: If an error occurs during the execution of the method.
         """
         try:
-            self.actionCommitCSPR.triggered.connect(
-                lambda: add_cspr_data(
+            self.actionCommitCSPR.triggered.connect(self.page_loader.after_building(
+                CSPR_PAGE, lambda: add_cspr_data(
                     self, {
                         "cspr_date": "cspr_date",
                         "cspr_time": "cspr_time",
@@ -497,32 +506,36 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                         "rage_slider": "rage_slider",
                         "model": "cspr_model"
                     },
-                    self.db_manager.insert_into_cspr_exam, ))
+                    self.db_manager.insert_into_cspr_exam, )))
         except Exception as e:
             logger.error(f"An Error has occurred {e}", exc_info=True)
     
     def wefe_commit(self) -> None:
         """
         Connects the actionCommitWEFE signal to the add_wefe_data function with the specified parameters.
-        Inserts the WEFE data into the WEFE table using the db_manager.
+        Inserts the WEFE data into the WEFE table using the db_manager. A pending summary
+        update is flushed first, so the committed sum matches the sliders.
 
         Raises:
             Exception: If an error occurs during the execution of the method.
         """
+        def commit():
+            self.beck_summary.flush()
+            add_wefe_data(
+                self, {
+                    "wefe_date": "wefe_date",
+                    "wefe_time": "wefe_time",
+                    "wellbeing_slider": "wellbeing_slider",
+                    "excite_slider": "excite_slider",
+                    "focus_slider": "focus_slider",
+                    "energy_slider": "energy_slider",
+                    "summing_box": "summing_box",
+                    "model": "wefe_model"
+                },
+                self.db_manager.insert_into_wefe_table, )
+
         try:
-            self.actionCommitWEFE.triggered.connect(
-                lambda: add_wefe_data(
-                    self, {
-                        "wefe_date": "wefe_date",
-                        "wefe_time": "wefe_time",
-                        "wellbeing_slider": "wellbeing_slider",
-                        "excite_slider": "excite_slider",
-                        "focus_slider": "focus_slider",
-                        "energy_slider": "energy_slider",
-                        "summing_box": "summing_box",
-                        "model": "wefe_model"
-                    },
-                    self.db_manager.insert_into_wefe_table, ))
+            self.actionCommitWEFE.triggered.connect(self.page_loader.after_building(WEFE_PAGE, commit))
         except Exception as e:
             logger.error(f"An Error has occurred {e}", exc_info=True)
     
@@ -561,35 +574,52 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         except Exception as e:
             logger.error(f"Error setting up delete actions: {e}", exc_info=True)
         
-    def setup_models(self) -> None:
+    def load_model(self, attribute: str, table_name: str, table_view: QtWidgets.QTableView) -> None:
         """
-        Set up models for various tables in the main window.
+        Loads the model of a table view page into one of the model attributes.
 
-        This method creates and sets models for different tables in the main window.
-        It uses the `create_and_set_model` function to create and set the models.
+        Until the window is first shown, the model is queued in startup_models
+        instead, so building the restored page doesn't wait for its rows.
 
-        Raises:
-            Exception: If there is an error setting up the models.
+        Args:
+            attribute (str): The model attribute, e.g. 'wefe_model'.
+            table_name (str): The database table shown in the view.
+            table_view (QTableView): The table view to set the model on.
+        """
+        if self.startup_models is not None:
+            self.startup_models.append((attribute, table_name, table_view))
+        else:
+            setattr(self, attribute, self.setup_model(table_name, table_view))
+
+    def load_startup_models(self) -> None:
+        """
+        Loads the models queued while the window was built, each with its first screen of rows.
+        """
+        startup_models, self.startup_models = self.startup_models or [], None
+        with measure("ui.startup_models"):
+            for attribute, table_name, table_view in startup_models:
+                self.load_model(attribute, table_name, table_view)
 
+    @staticmethod
+    def setup_model(table_name: str, table_view: QtWidgets.QTableView):
+        """
+        Set up the model of one table view in the main window.
+
+        This method uses the `create_and_set_model` function to create and set the model.
+        It is called through load_model, when a table view page is built.
+
+        Args:
+            table_name (str): The database table shown in the view.
+            table_view (QTableView): The table view to set the model on.
+
+        Returns:
+            QSqlTableModel: The model, or None if it could not be set up.
         """
         try:
-            self.wefe_model = create_and_set_model(
-                "wefe_table",
-                self.wefe_tableview
-            )
-            
-            self.cspr_model = create_and_set_model(
-                "cspr_table",
-                self.cspr_tableview
-            )
-            
-            self.mental_mental_model = create_and_set_model(
-                "mental_mental_table",
-                self.mental_mental_table
-            )
-            
+            return create_and_set_model(table_name, table_view)
         except Exception as e:
             logger.error(f"Error setting up models: {e}", exc_info=True)
+            return None
     
     def save_state(self):
         """
@@ -636,6 +666,36 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         except Exception as e:
             logger.error(f"Error restoring WINDOW STATE {e}", exc_info=True)
     
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Shows the main window, then loads the startup models on the next event loop pass.
+
+        The select of the restored page's model overlaps the window's first paint
+        instead of delaying it.
+
+        Args:
+            event (QShowEvent): The show event object.
+
+        Returns:
+            None
+        """
+        super().showEvent(event)
+        if self.startup_models is not None:
+            QTimer.singleShot(0, self.load_startup_models)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Paints the main window, reporting the first paint to the startup profiler.
+
+        Args:
+            event (QPaintEvent): The paint event object.
+
+        Returns:
+            None
+        """
+        startup_profiler.first_paint()
+        super().paintEvent(event)
+    
     def closeEvent(self, event: QCloseEvent) -> None:
         """
         Event handler for the close event of the main window.
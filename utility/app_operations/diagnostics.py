@@ -0,0 +1,143 @@
+import os
+import time
+from typing import Dict, Optional
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+from PyQt6.QtWidgets import QFormLayout, QLabel, QWidget
+import tracker_config as tkc
+from logger_setup import logger, log_queue, queue_handler
+from database.database_utility.query_log import query_log
+from analytics.result_cache import result_cache
+from database.database_utility.table_columns import TABLE_SLIDER_COLUMNS
+from utility.app_operations.instrumentation import instrumentation
+from utility.app_operations.process_stats import current_rss_bytes, peak_rss_bytes, python_heap_blocks
+
+# diagnostics.py
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """Formats a byte count for display, '-' when unknown."""
+    if size is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_latency(summary: Optional[dict]) -> str:
+    """Formats a histogram summary as count, p50 and p99 in milliseconds."""
+    if not summary or not summary["count"]:
+        return "-"
+    return (f"{summary['count']}x  p50 {summary['p50_us'] / 1000:.1f} ms  "
+            f"p99 {summary['p99_us'] / 1000:.1f} ms")
+
+
+def count_rows(table_name: str) -> int:
+    """Counts the rows of a tracker table."""
+    query = QSqlQuery(QSqlDatabase.database())
+    if query_log.exec(query, f"SELECT COUNT(*) FROM {table_name}") and query.next():
+        return query.value(0)
+    logger.error(f"Error counting rows of {table_name}: {query.lastError().text()}")
+    return 0
+
+
+class DiagnosticsPanel(QWidget):
+    """
+    Live performance counters of the running app.
+
+    The counters refresh on a timer every DIAGNOSTICS_REFRESH_MS while the panel is
+    running, and only read figures that are already aggregated: row counts come from
+    the result cache and are only recounted after their table changes, latencies from
+    the instrumentation histograms, and the rest from file sizes and process stats.
+
+    The same timer measures event-loop lag: how late each tick fires compared to
+    its interval, which is the time the loop spent busy with something else.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("diagnosticsPanel")
+        self.form = QFormLayout(self)
+        self.values: Dict[str, QLabel] = {}
+        for table_name in TABLE_SLIDER_COLUMNS:
+            self.add_row(f"rows {table_name}")
+        for name in ("db file", "db wal", "insert latency", "select latency",
+                     "page switch latency", "log write queue", "event loop lag", "event loop lag max",
+                     "python heap blocks", "rss", "peak rss"):
+            self.add_row(name)
+
+        self.max_lag_ms = 0.0
+        self.last_tick: Optional[float] = None
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(tkc.DIAGNOSTICS_REFRESH_MS)
+        self.timer.timeout.connect(self.on_tick)
+
+    def add_row(self, name: str) -> None:
+        """Adds a labelled counter to the form."""
+        label = QLabel("-", self)
+        label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.values[name] = label
+        self.form.addRow(name, label)
+
+    def start(self) -> None:
+        """Refreshes the counters now and then on every tick."""
+        self.last_tick = None
+        self.refresh()
+        self.timer.start()
+
+    def stop(self) -> None:
+        """Stops refreshing, e.g. while the panel is hidden."""
+        self.timer.stop()
+
+    def on_tick(self) -> None:
+        now = time.perf_counter()
+        if self.last_tick is not None:
+            lag_ms = max((now - self.last_tick) * 1000 - self.timer.interval(), 0.0)
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            self.values["event loop lag"].setText(f"{lag_ms:.1f} ms")
+            self.values["event loop lag max"].setText(f"{self.max_lag_ms:.1f} ms")
+        self.last_tick = now
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Reads the counters and updates the labels."""
+        try:
+            for table_name in TABLE_SLIDER_COLUMNS:
+                rows = result_cache.get_or_compute("row_count", (table_name,), (table_name,),
+                                                   lambda table=table_name: count_rows(table))
+                self.values[f"rows {table_name}"].setText(f"{rows:,}")
+
+            db_file = QSqlDatabase.database().databaseName()
+            self.values["db file"].setText(format_bytes(self.file_size(db_file)))
+            self.values["db wal"].setText(format_bytes(self.file_size(f"{db_file}-wal")))
+
+            inserts = instrumentation.summaries("db.insert.")
+            self.values["insert latency"].setText(
+                "\n".join(f"{name[len('db.insert.'):]}: {format_latency(summary)}"
+                          for name, summary in inserts.items()) or "-")
+            selects = instrumentation.summaries("db.select.")
+            self.values["select latency"].setText(
+                "\n".join(f"{name[len('db.select.'):]}: {format_latency(summary)}"
+                          for name, summary in selects.items()) or "-")
+            switches = instrumentation.summaries("ui.page_switch.")
+            self.values["page switch latency"].setText(
+                "\n".join(f"page {name[len('ui.page_switch.'):]}: {format_latency(summary)}"
+                          for name, summary in switches.items()) or "-")
+
+            self.values["log write queue"].setText(f"{log_queue.qsize()} queued, {queue_handler.dropped} dropped")
+            self.values["python heap blocks"].setText(f"{python_heap_blocks():,}")
+            self.values["rss"].setText(format_bytes(current_rss_bytes()))
+            self.values["peak rss"].setText(format_bytes(peak_rss_bytes()))
+        except Exception as e:
+            logger.error(f"Error refreshing diagnostics: {e}", exc_info=True)
+
+    @staticmethod
+    def file_size(path: str) -> Optional[int]:
+        """Returns the size of a file, None if it doesn't exist."""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return None
@@ -1,9 +1,32 @@
+import functools
 from PyQt6.QtWidgets import QMainWindow, QApplication
 from PyQt6.QtCore import Qt, QRectF
 from PyQt6.QtGui import QPainter, QPainterPath, QRegion, QMouseEvent, QResizeEvent
+import tracker_config as tkc
 from logger_setup import logger
 
 
+@functools.lru_cache(maxsize=tkc.WINDOW_MASK_CACHE_SIZE)
+def rounded_mask(width: int, height: int, radius: float = tkc.WINDOW_CORNER_RADIUS) -> QRegion:
+    """
+    Returns the rounded-rectangle mask of a window of the given size.
+
+    Converting the rounded path to a region is the expensive part of a resize, and
+    the window only ever takes a handful of sizes, so the regions are cached.
+
+    Args:
+        width (int): The window's width.
+        height (int): The window's height.
+        radius (float): The corner radius.
+
+    Returns:
+        QRegion: The mask.
+    """
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(0, 0, width, height), radius, radius)
+    return QRegion(path.toFillPolygon().toPolygon())
+
+
 class FramelessWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -11,6 +34,7 @@ class FramelessWindow(QMainWindow):
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.pressing = False
+        self.mask_size = None
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         try:
@@ -36,12 +60,12 @@ class FramelessWindow(QMainWindow):
 
     def resizeEvent(self, event: QResizeEvent):
         try:
-            path = QPainterPath()
-            path.addRoundedRect(QRectF(self.rect()), 10.0, 10.0)
-
-            # Create a QRegion from the QPainterPath
-            region = QRegion(path.toFillPolygon().toPolygon())
-            self.setMask(region)
+            # setFixedSize with the current size still sends a resize event
+            size = event.size()
+            if size == self.mask_size:
+                return
+            self.setMask(rounded_mask(size.width(), size.height()))
+            self.mask_size = size
         except Exception as e:
             logger.error(f"error occurred resizeEvent: {e}", exc_info=True)
 
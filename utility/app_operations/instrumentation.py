@@ -0,0 +1,228 @@
+import atexit
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+import tracker_config as tkc
+from logger_setup import logger, log_directory
+
+# instrumentation.py
+# Qt-free, so it can time anything from imports onwards.
+
+SUB_BUCKET_BITS = 6  # 32 sub-buckets per power of two, at most ~3% relative error
+HALF_SUB_BUCKETS = 1 << (SUB_BUCKET_BITS - 1)
+MAX_TRACKABLE_US = 1 << 36  # ~19 hours, longer latencies are clamped
+BUCKET_COUNT = (MAX_TRACKABLE_US.bit_length() - SUB_BUCKET_BITS + 2) * HALF_SUB_BUCKETS
+
+
+def bucket_index(value_us: int) -> int:
+    """
+    Maps a latency to its histogram bucket.
+
+    Values below 2**SUB_BUCKET_BITS get a bucket each. Above that, every power of two
+    is split into HALF_SUB_BUCKETS equal buckets, so a bucket is never wider than
+    about 1/HALF_SUB_BUCKETS of the values it holds, as in an HDR histogram.
+
+    Args:
+        value_us (int): The latency in microseconds.
+
+    Returns:
+        int: The bucket index.
+    """
+    exponent = max(value_us.bit_length() - SUB_BUCKET_BITS, 0)
+    return exponent * HALF_SUB_BUCKETS + (value_us >> exponent)
+
+
+def bucket_bounds(index: int) -> List[int]:
+    """Returns the lowest and highest latency in microseconds of a bucket."""
+    if index < 2 * HALF_SUB_BUCKETS:
+        return [index, index]
+    exponent = index // HALF_SUB_BUCKETS - 1
+    mantissa = index - exponent * HALF_SUB_BUCKETS
+    return [mantissa << exponent, ((mantissa + 1) << exponent) - 1]
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with log-linear buckets.
+
+    Recording is an index computation and a list increment, with no allocation, so
+    it can sit on hot paths. Percentiles are read from the buckets and are accurate
+    to the bucket width.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, value_us: int) -> None:
+        """Records one latency in microseconds."""
+        value_us = min(max(value_us, 0), MAX_TRACKABLE_US)
+        self.counts[bucket_index(value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the latency at the given percentile, in microseconds.
+
+        Args:
+            percent (float): The percentile, 0 to 100.
+
+        Returns:
+            int: The upper bound of the bucket holding the percentile, capped at the
+            largest recorded value. 0 when nothing has been recorded.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, round(percent / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bucket_bounds(index)[1], self.max_us)
+        return self.max_us
+
+    def summary(self) -> dict:
+        """Returns the count, extremes, mean and main percentiles."""
+        return {
+            "count": self.count,
+            "min_us": self.min_us or 0,
+            "max_us": self.max_us,
+            "mean_us": round(self.total_us / self.count, 1) if self.count else 0,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "p999_us": self.percentile(99.9),
+        }
+
+    def to_dict(self) -> dict:
+        """Returns the summary statistics and the non-empty buckets."""
+        return dict(self.summary(), buckets=[bucket_bounds(index) + [bucket_count]
+                                             for index, bucket_count in enumerate(self.counts)
+                                             if bucket_count])
+
+
+class Instrumentation:
+    """
+    Named latency histograms for the app's user-facing operations.
+
+    Operations are timed with the timed decorator or the measure context manager.
+    The histograms live for the whole session and are written to JSON by dump,
+    on demand and at exit.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.lock = threading.Lock()
+        self.started = datetime.datetime.now()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Records a latency, in seconds, in the histogram called name."""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(int(seconds * 1_000_000))
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Times the enclosed block into the histogram called name."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name: str) -> Callable[[Callable], Callable]:
+        """
+        Decorator that times every call of the function into the histogram called name.
+
+        Args:
+            name (str): The histogram's name, e.g. 'db.insert.wefe_table'.
+
+        Returns:
+            Callable[[Callable], Callable]: The decorator.
+        """
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def summaries(self, prefix: str = "") -> Dict[str, dict]:
+        """
+        Returns the summary of every histogram whose name starts with prefix.
+
+        Args:
+            prefix (str): e.g. 'db.insert.', empty for all histograms.
+
+        Returns:
+            Dict[str, dict]: Histogram name to LatencyHistogram.summary().
+        """
+        with self.lock:
+            return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())
+                    if name.startswith(prefix)}
+
+    def snapshot(self) -> dict:
+        """Returns every histogram as a dict, keyed by name."""
+        with self.lock:
+            return {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())}
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Writes the histograms to a JSON file.
+
+        Args:
+            path (str): Where to write, defaults to ~/minder/LATENCY_HISTOGRAM_FILE.
+
+        Returns:
+            Optional[str]: The path written, or None on failure.
+        """
+        path = path or os.path.join(log_directory, tkc.LATENCY_HISTOGRAM_FILE)
+        try:
+            report = {
+                "session_start": self.started.isoformat(timespec="seconds"),
+                "written": datetime.datetime.now().isoformat(timespec="seconds"),
+                "unit": "microseconds",
+                "histograms": self.snapshot(),
+            }
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(report, file, indent=2)
+            return path
+        except Exception as e:
+            logger.error(f"Error writing latency histograms: {e}", exc_info=True)
+            return None
+
+    def dump_at_exit(self) -> None:
+        """Writes the histograms at exit if anything was recorded."""
+        if self.histograms:
+            self.dump()
+
+
+instrumentation = Instrumentation(tkc.INSTRUMENTATION_ENABLED)
+timed = instrumentation.timed
+measure = instrumentation.measure
+atexit.register(instrumentation.dump_at_exit)
@@ -0,0 +1,56 @@
+import importlib
+from types import ModuleType
+from typing import Any, Optional
+from logger_setup import logger
+
+# lazy_imports.py
+
+
+class LazyModule:
+    """
+    Stands in for a module that is imported the first time one of its names is used.
+
+    Meant for heavy Qt modules behind rarely used features, such as printing and
+    export, so that importing the window doesn't load them. After the first
+    attribute access the real module is cached and lookups are plain getattr calls.
+    """
+
+    def __init__(self, module_name: str) -> None:
+        """
+        Initializes the stand-in without importing anything.
+
+        Args:
+            module_name (str): The fully qualified name of the module, e.g. 'PyQt6.QtPrintSupport'.
+        """
+        self.module_name = module_name
+        self.module: Optional[ModuleType] = None
+
+    def load(self) -> ModuleType:
+        """
+        Imports the module if it hasn't been imported yet.
+
+        Returns:
+            ModuleType: The real module.
+
+        Raises:
+            ImportError: If the module can't be imported.
+        """
+        if self.module is None:
+            try:
+                self.module = importlib.import_module(self.module_name)
+            except ImportError as e:
+                logger.error(f"Error importing {self.module_name}: {e}", exc_info=True)
+                raise
+        return self.module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns True once the module has been imported."""
+        return self.module is not None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that aren't set on the stand-in itself
+        return getattr(self.load(), name)
+
+
+QtPrintSupport = LazyModule("PyQt6.QtPrintSupport")
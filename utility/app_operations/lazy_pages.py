@@ -0,0 +1,70 @@
+from typing import Callable, Dict
+from PyQt6.QtWidgets import QStackedWidget
+from logger_setup import logger
+from utility.app_operations.instrumentation import measure
+from utility.app_operations.memory_profiler import memory_profiler
+
+# lazy_pages.py
+
+
+class LazyPageLoader:
+    """
+    Builds the pages of a QStackedWidget the first time they are needed.
+
+    Each page index maps to a builder that fills the (empty) page widget. A page is
+    built when it becomes the current page, whichever way the stack was switched,
+    or when ensure_built is called for it, e.g. by code that needs its widgets
+    before the user opens it. Builders run at most once.
+    """
+
+    def __init__(self, stack: QStackedWidget, builders: Dict[int, Callable[[], None]]) -> None:
+        """
+        Initializes the loader and hooks it up to the stack's page changes.
+
+        Args:
+            stack (QStackedWidget): The stack whose pages are built on demand.
+            builders (Dict[int, Callable[[], None]]): Page index to builder.
+        """
+        self.stack = stack
+        self.builders = dict(builders)
+        self.stack.currentChanged.connect(self.ensure_built)
+
+    def is_built(self, index: int) -> bool:
+        """Returns True if the page at index has been built or needs no building."""
+        return index not in self.builders
+
+    def ensure_built(self, index: int) -> None:
+        """
+        Builds the page at index unless it has been built already.
+
+        Args:
+            index (int): The page index in the stack.
+
+        Returns:
+            None
+        """
+        builder = self.builders.pop(index, None)
+        if builder is None:
+            return
+        try:
+            with measure(f"ui.page_build.{index}"):
+                builder()
+            memory_profiler.checkpoint(f"page_build.{index}")
+        except Exception as e:
+            logger.error(f"Error building page {index}: {e}", exc_info=True)
+
+    def after_building(self, index: int, callback: Callable[[], None]) -> Callable[..., None]:
+        """
+        Wraps callback so that the page at index is built before it runs.
+
+        Args:
+            index (int): The page whose widgets callback uses.
+            callback (Callable[[], None]): The function to wrap.
+
+        Returns:
+            Callable[..., None]: A slot that ignores the signal's arguments.
+        """
+        def run(*_) -> None:
+            self.ensure_built(index)
+            callback()
+        return run
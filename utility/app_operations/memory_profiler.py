@@ -0,0 +1,177 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import tracemalloc
+from typing import Dict, List, Optional
+import tracker_config as tkc
+from logger_setup import logger
+from utility.app_operations.process_stats import current_rss_bytes, peak_rss_bytes
+
+# memory_profiler.py
+# Qt-free like the startup profiler, so tracing can start before PyQt6 is imported.
+
+REPORT_VERSION = 1
+profile_directory = os.path.join(os.path.expanduser('~'), tkc.PRINGLES)
+application_directory = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Allocations made by the profiler itself and by the import machinery are noise
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryProfiler:
+    """
+    Takes tracemalloc snapshots at named checkpoints and reports what grew in between.
+
+    Disabled unless run_app is started with --profile-memory, in which case Python
+    allocations are traced from then on and checkpoint() snapshots them. Each
+    checkpoint is diffed against the previous one, and the top allocators by line
+    and by file go into a JSON report, rewritten at every checkpoint.
+
+    tracemalloc only sees the Python heap. Every checkpoint also records the RSS,
+    and the part of its growth that tracemalloc doesn't account for is reported as
+    native: memory held by Qt and SQLite, such as the rows a QSqlTableModel caches
+    or loaded resources. The growth of each checkpoint is split into 'application'
+    (our own modules), 'libraries' (everything else Python) and 'native'.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.report_path: Optional[str] = None
+        self.top = tkc.MEMORY_PROFILE_TOP
+        self.previous: Optional[tracemalloc.Snapshot] = None
+        self.previous_rss: Optional[int] = None
+        self.previous_traced = 0
+        self.checkpoints: List[Dict] = []
+
+    def configure(self, argv: List[str]) -> List[str]:
+        """
+        Enables profiling if argv asks for it and strips the profiling option.
+
+        Recognised options:
+            --profile-memory[=PATH]  JSON report, default ~/minder/memory_profile.json
+
+        Args:
+            argv (List[str]): The command line, program name first.
+
+        Returns:
+            List[str]: argv without the profiling option, for QApplication.
+        """
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("--profile-memory", nargs="?", default=None,
+                            const=os.path.join(profile_directory, tkc.MEMORY_PROFILE_FILE))
+        options, remaining = parser.parse_known_args(argv[1:])
+        if options.profile_memory:
+            self.start(options.profile_memory)
+        return argv[:1] + remaining
+
+    def start(self, report_path: str) -> None:
+        """Starts tracing and takes the 'start' checkpoint."""
+        self.enabled = True
+        self.report_path = report_path
+        tracemalloc.start(tkc.MEMORY_PROFILE_FRAMES)
+        self.checkpoint("start")
+
+    def checkpoint(self, name: str) -> None:
+        """
+        Snapshots the traced memory and records what changed since the last checkpoint.
+
+        Args:
+            name (str): The checkpoint's name, e.g. 'page_build.4'.
+
+        Returns:
+            None
+        """
+        if not self.enabled:
+            return
+        try:
+            snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+            traced = sum(trace.size for trace in snapshot.traces)
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            rss = current_rss_bytes()
+            entry = {
+                "name": name,
+                "timestamp": datetime.datetime.now().isoformat(timespec="milliseconds"),
+                "rss_bytes": rss,
+                "peak_rss_bytes": peak_rss_bytes(),
+                "traced_bytes": traced,
+                "traced_peak_bytes": traced_peak,
+            }
+            if self.previous is not None:
+                traced_delta = traced - self.previous_traced
+                entry["traced_delta_bytes"] = traced_delta
+                if rss is not None and self.previous_rss is not None:
+                    entry["rss_delta_bytes"] = rss - self.previous_rss
+                    entry["native_delta_bytes"] = rss - self.previous_rss - traced_delta
+                entry["origins"] = self.origins(snapshot, entry.get("native_delta_bytes"))
+                entry["top_lines"] = self.top_differences(snapshot, 'lineno')
+                entry["top_files"] = self.top_differences(snapshot, 'filename')
+            self.checkpoints.append(entry)
+            self.previous, self.previous_rss, self.previous_traced = snapshot, rss, traced
+            self.write_report()
+        except Exception as e:
+            logger.error(f"Error taking memory checkpoint {name}: {e}", exc_info=True)
+
+    def top_differences(self, snapshot: tracemalloc.Snapshot, key_type: str) -> List[Dict]:
+        """
+        Returns the allocators that grew the most since the previous snapshot.
+
+        Args:
+            snapshot (tracemalloc.Snapshot): The new snapshot.
+            key_type (str): 'lineno' or 'filename'.
+
+        Returns:
+            List[Dict]: Up to MEMORY_PROFILE_TOP entries, largest growth first.
+        """
+        differences = snapshot.compare_to(self.previous, key_type)
+        return [{
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}"
+            if key_type == 'lineno' else stat.traceback[0].filename,
+            "size_delta_bytes": stat.size_diff,
+            "size_bytes": stat.size,
+            "count_delta": stat.count_diff,
+        } for stat in differences[:self.top] if stat.size_diff]
+
+    def origins(self, snapshot: tracemalloc.Snapshot, native_delta: Optional[int]) -> Dict[str, int]:
+        """
+        Splits the growth since the previous snapshot by where it was allocated.
+
+        Args:
+            snapshot (tracemalloc.Snapshot): The new snapshot.
+            native_delta (int): The RSS growth tracemalloc doesn't see, if known.
+
+        Returns:
+            Dict[str, int]: Bytes grown by 'application', 'libraries' and 'native'.
+        """
+        origins = {"application": 0, "libraries": 0}
+        for stat in snapshot.compare_to(self.previous, 'filename'):
+            filename = os.path.abspath(stat.traceback[0].filename)
+            is_application = (filename.startswith(application_directory + os.sep)
+                              and 'site-packages' not in filename)
+            origins["application" if is_application else "libraries"] += stat.size_diff
+        if native_delta is not None:
+            origins["native"] = native_delta
+        return origins
+
+    def write_report(self) -> None:
+        """Writes the checkpoints so far to the JSON report."""
+        report = {
+            "version": REPORT_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "frames": tkc.MEMORY_PROFILE_FRAMES,
+            "checkpoints": self.checkpoints,
+        }
+        os.makedirs(os.path.dirname(self.report_path) or ".", exist_ok=True)
+        with open(self.report_path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+
+memory_profiler = MemoryProfiler()
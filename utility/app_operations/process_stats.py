@@ -0,0 +1,49 @@
+import os
+import sys
+from typing import Optional
+from logger_setup import logger
+
+# process_stats.py
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def current_rss_bytes() -> Optional[int]:
+    """
+    Returns the resident set size of this process, or None where it can't be read
+    without extra dependencies (only Linux exposes it through /proc).
+
+    Returns:
+        Optional[int]: The RSS in bytes.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Returns the peak resident set size of this process so far.
+
+    Returns:
+        Optional[int]: The peak RSS in bytes, None where the resource module is missing.
+    """
+    if resource is None:
+        return None
+    try:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except Exception as e:
+        logger.error(f"Error reading peak RSS: {e}", exc_info=True)
+        return None
+
+
+def python_heap_blocks() -> int:
+    """Returns the number of memory blocks currently allocated by the interpreter."""
+    return sys.getallocatedblocks()
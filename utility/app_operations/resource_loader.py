@@ -0,0 +1,34 @@
+import os
+from PyQt6.QtCore import QResource
+from logger_setup import logger
+
+# resource_loader.py
+
+# Binary resource bundle (rcc -binary) with the images of the :/newPrefix prefix.
+# Rebuild it from the .qrc referenced by 3AUG1_MoMDMrWEFECSPRExams.ui with:
+#   rcc -binary minde.qrc -o ui/main_ui/res.rcc
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             'ui', 'main_ui', 'res.rcc')
+
+
+def register_resources(resource_file: str = RESOURCE_FILE) -> bool:
+    """
+    Registers the application's binary resource bundle with Qt.
+
+    Qt memory-maps the file, so nothing is parsed or copied into the Python heap
+    and pages are only read when a resource is actually used.
+
+    Args:
+        resource_file (str): Path to the .rcc file.
+
+    Returns:
+        bool: True if the resources were registered, False otherwise.
+    """
+    try:
+        if not QResource.registerResource(resource_file):
+            logger.error(f"Unable to register resources from {resource_file}")
+            return False
+        return True
+    except Exception as e:
+        logger.error(f"Error registering resources: {e}", exc_info=True)
+        return False
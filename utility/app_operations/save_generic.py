@@ -1,8 +1,7 @@
 import logging
 from PyQt6.QtWidgets import QTextEdit, QFileDialog
 from PyQt6.QtCore import QFileInfo, QByteArray
-from PyQt6.QtGui import QTextDocument, QTextDocumentWriter
-from PyQt6.QtPrintSupport import QPrinter
+from utility.app_operations.lazy_imports import QtPrintSupport
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +58,8 @@ class TextEditSaver:
                     filename += ".txt"  # Default to .txt if no valid extension is provided
 
                 if file_extension == "pdf":
+                    # The print stack is only loaded the first time a PDF is saved
+                    QPrinter = QtPrintSupport.QPrinter
                     printer = QPrinter(QPrinter.PrinterMode.HighResolution)
                     printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
                     printer.setOutputFileName(filename)
@@ -0,0 +1,102 @@
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+from PyQt6.QtCore import QObject, Qt, QTimer
+import tracker_config as tkc
+from logger_setup import logger
+from utility.app_operations.instrumentation import instrumentation
+
+# stall_watchdog.py
+
+
+class StallWatchdog(QObject):
+    """
+    Detects event-loop stalls and logs where the main thread is stuck.
+
+    A timer on the main thread stamps a heartbeat every STALL_HEARTBEAT_MS. A daemon
+    thread checks the stamp, and once it is older than STALL_THRESHOLD_MS the main
+    thread is busy outside the event loop: the watchdog grabs its Python stack with
+    sys._current_frames() while the stall is still going on and logs it. When the
+    heartbeat comes back, the total duration is logged and recorded in the
+    'ui.event_loop_stall' histogram.
+
+    The watchdog only reads frames, it never interrupts the main thread.
+    """
+
+    def __init__(self, heartbeat_ms: int = tkc.STALL_HEARTBEAT_MS,
+                 threshold_ms: int = tkc.STALL_THRESHOLD_MS, parent: Optional[QObject] = None) -> None:
+        """
+        Initializes the watchdog on the main thread without starting it.
+
+        Args:
+            heartbeat_ms (int): Interval of the heartbeat timer.
+            threshold_ms (int): Heartbeat silence that counts as a stall.
+            parent (QObject): The watchdog's parent.
+        """
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.main_thread_id = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self.stall_started: Optional[float] = None
+        self.stalls = 0
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setTimerType(Qt.TimerType.PreciseTimer)
+        self.heartbeat.setInterval(heartbeat_ms)
+        self.heartbeat.timeout.connect(self.beat)
+
+    def start(self) -> None:
+        """Starts the heartbeat and the watchdog thread."""
+        self.last_beat = time.monotonic()
+        self.heartbeat.start()
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.watch, name="stall-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stops the watchdog thread and the heartbeat."""
+        self.stopping.set()
+        self.heartbeat.stop()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def beat(self) -> None:
+        """Stamps the heartbeat, and closes the current stall if there is one."""
+        with self.lock:
+            now = time.monotonic()
+            stall_started, self.stall_started = self.stall_started, None
+            self.last_beat = now
+        if stall_started is not None:
+            duration = now - stall_started
+            instrumentation.record("ui.event_loop_stall", duration)
+            logger.error(f"Event loop stall ended after {duration * 1000:.0f} ms")
+
+    def watch(self) -> None:
+        """Runs on the watchdog thread, polling the heartbeat until stopped."""
+        poll = min(self.heartbeat.interval() / 1000, self.threshold / 4)
+        while not self.stopping.wait(poll):
+            with self.lock:
+                silence = time.monotonic() - self.last_beat
+                if silence < self.threshold or self.stall_started is not None:
+                    continue
+                self.stall_started = self.last_beat
+                self.stalls += 1
+            logger.error(f"Event loop stalled for {silence * 1000:.0f} ms, main thread stack:\n"
+                         f"{self.main_thread_stack()}")
+
+    def main_thread_stack(self) -> str:
+        """Returns the formatted Python stack of the main thread."""
+        try:
+            frame = sys._current_frames().get(self.main_thread_id)
+            if frame is None:
+                return "(main thread not found)"
+            return "".join(traceback.format_stack(frame))
+        except Exception as e:
+            logger.error(f"Error capturing the main thread stack: {e}", exc_info=True)
+            return "(stack unavailable)"
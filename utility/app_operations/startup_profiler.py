@@ -0,0 +1,136 @@
+import argparse
+import cProfile
+import datetime
+import json
+import os
+import platform
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+import tracker_config as tkc
+from logger_setup import logger
+
+# startup_profiler.py
+# Deliberately free of Qt imports, so importing it doesn't hide PyQt6 import time.
+
+REPORT_VERSION = 1
+profile_directory = os.path.join(os.path.expanduser('~'), tkc.PRINGLES)
+
+
+class StartupProfiler:
+    """
+    Times the phases of application startup and writes them as a JSON report.
+
+    Disabled unless run_app is started with --profile-startup, in which case phase()
+    costs a perf_counter call on entry and exit. Phases nest: a phase opened inside
+    another one records it as its parent. The report is written at first paint.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.finished = False
+        self.origin = 0.0
+        self.report_path: Optional[str] = None
+        self.cprofile_path: Optional[str] = None
+        self.cprofile: Optional[cProfile.Profile] = None
+        self.phases: List[Dict] = []
+        self.open_phases: List[str] = []
+
+    def configure(self, argv: List[str]) -> List[str]:
+        """
+        Enables profiling if argv asks for it and strips the profiling options.
+
+        Recognised options:
+            --profile-startup[=PATH]           JSON report, default ~/minder/startup_profile.json
+            --profile-startup-cprofile[=PATH]  also dump cProfile stats, default
+                                               ~/minder/startup_profile.prof
+
+        Args:
+            argv (List[str]): The command line, program name first.
+
+        Returns:
+            List[str]: argv without the profiling options, for QApplication.
+        """
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("--profile-startup", nargs="?", default=None,
+                            const=os.path.join(profile_directory, tkc.STARTUP_PROFILE_FILE))
+        parser.add_argument("--profile-startup-cprofile", nargs="?", default=None,
+                            const=os.path.join(profile_directory, tkc.STARTUP_CPROFILE_FILE))
+        options, remaining = parser.parse_known_args(argv[1:])
+        if options.profile_startup_cprofile and not options.profile_startup:
+            options.profile_startup = os.path.join(profile_directory, tkc.STARTUP_PROFILE_FILE)
+        if options.profile_startup:
+            self.start(options.profile_startup, options.profile_startup_cprofile)
+        return argv[:1] + remaining
+
+    def start(self, report_path: str, cprofile_path: Optional[str] = None) -> None:
+        """Starts timing, and cProfile if cprofile_path is given."""
+        self.enabled = True
+        self.report_path = report_path
+        self.cprofile_path = cprofile_path
+        self.origin = time.perf_counter()
+        if cprofile_path:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as a startup phase."""
+        if not self.enabled or self.finished:
+            yield
+            return
+        parent = self.open_phases[-1] if self.open_phases else None
+        self.open_phases.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.open_phases.pop()
+            self.phases.append({
+                "name": name,
+                "parent": parent,
+                "start_ms": round((start - self.origin) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+            })
+
+    def first_paint(self) -> None:
+        """Records the first paint of the main window and writes the report."""
+        if not self.enabled or self.finished:
+            return
+        self.phases.append({
+            "name": "first_paint",
+            "parent": None,
+            "start_ms": round((time.perf_counter() - self.origin) * 1000, 3),
+            "duration_ms": 0.0,
+        })
+        self.finish()
+
+    def finish(self) -> None:
+        """Stops profiling and writes the JSON report and the cProfile dump."""
+        if not self.enabled or self.finished:
+            return
+        self.finished = True
+        total_ms = round((time.perf_counter() - self.origin) * 1000, 3)
+        try:
+            if self.cprofile is not None:
+                self.cprofile.disable()
+                os.makedirs(os.path.dirname(self.cprofile_path) or ".", exist_ok=True)
+                self.cprofile.dump_stats(self.cprofile_path)
+            report = {
+                "version": REPORT_VERSION,
+                "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "total_ms": total_ms,
+                "phases": sorted(self.phases, key=lambda phase: phase["start_ms"]),
+                "cprofile": self.cprofile_path,
+            }
+            os.makedirs(os.path.dirname(self.report_path) or ".", exist_ok=True)
+            with open(self.report_path, 'w', encoding='utf-8') as file:
+                json.dump(report, file, indent=2)
+        except Exception as e:
+            logger.error(f"Error writing startup profile: {e}", exc_info=True)
+
+
+startup_profiler = StartupProfiler()
@@ -0,0 +1,33 @@
+import os
+from PyQt6.QtWidgets import QApplication
+from logger_setup import logger
+
+# stylesheet_loader.py
+
+# Application stylesheet with the styles of every widget in the main window.
+STYLESHEET_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                               'ui', 'main_ui', 'style.qss')
+
+
+def apply_stylesheet(app: QApplication, stylesheet_file: str = STYLESHEET_FILE) -> bool:
+    """
+    Sets the application stylesheet on the QApplication.
+
+    Qt parses an application stylesheet once and shares it between all widgets,
+    instead of parsing a sheet per widget and re-polishing each widget on its own.
+    Call it before the main window is created, so widgets are polished only once.
+
+    Args:
+        app (QApplication): The running application.
+        stylesheet_file (str): Path to the .qss file.
+
+    Returns:
+        bool: True if the stylesheet was applied, False otherwise.
+    """
+    try:
+        with open(stylesheet_file, 'r', encoding='utf-8') as file:
+            app.setStyleSheet(file.read())
+        return True
+    except Exception as e:
+        logger.error(f"Error applying stylesheet from {stylesheet_file}: {e}", exc_info=True)
+        return False
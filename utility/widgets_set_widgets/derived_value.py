@@ -0,0 +1,71 @@
+from typing import Callable
+from PyQt6.QtCore import QObject, QTimer, pyqtSlot
+import tracker_config as tkc
+from logger_setup import logger
+
+# derived_value.py
+
+
+class ThrottledDerivedValue(QObject):
+    """
+    Recomputes a value derived from several widgets, throttled to once per frame.
+
+    The widgets' change signals are connected to invalidate. The first change starts
+    a single-shot timer, and changes that arrive while it runs don't restart it, so
+    recompute runs delay_ms after the first change and covers all of them. During a
+    continuous slider drag that means one recompute per frame rather than one at the
+    end, and a change after a recompute starts the next frame, so the last value is
+    always picked up. Code that reads the derived value right away, like a commit,
+    calls flush first.
+    """
+
+    def __init__(self, recompute: Callable[[], None], parent: QObject = None,
+                 delay_ms: int = tkc.DERIVED_VALUE_DELAY_MS) -> None:
+        """
+        Initializes the derived value without computing it.
+
+        Args:
+            recompute (Callable[[], None]): Recomputes the value and shows it.
+            parent (QObject): The owner, the timer dies with it.
+            delay_ms (int): How long changes are collected after the first one, 0 for
+                the next event loop pass.
+        """
+        super().__init__(parent)
+        self.recompute = recompute
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.run)
+
+    def watch(self, *signals) -> None:
+        """
+        Invalidates the value whenever any of the signals is emitted.
+
+        Args:
+            *signals: Change signals of the widgets the value is derived from.
+        """
+        for signal in signals:
+            signal.connect(self.invalidate)
+
+    @pyqtSlot()
+    def invalidate(self) -> None:
+        """Schedules a recomputation, unless one is already pending, without postponing it."""
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def pending(self) -> bool:
+        """Returns whether a recomputation is scheduled."""
+        return self.timer.isActive()
+
+    def flush(self) -> None:
+        """Runs a pending recomputation now, so the value is current."""
+        if self.timer.isActive():
+            self.timer.stop()
+            self.run()
+
+    @pyqtSlot()
+    def run(self) -> None:
+        try:
+            self.recompute()
+        except Exception as e:
+            logger.error(f"Error updating derived value: {e}", exc_info=True)
@@ -1,26 +1,73 @@
+from typing import Optional
+from PyQt6.QtCore import QObject, QSignalBlocker, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QSlider, QSpinBox
 from logger_setup import logger
 
 
-def connect_slider_spinbox(slider: QSlider, spinbox: QSpinBox) -> None:
+class SliderSpinBinding(QObject):
     """
-    Connects a slider's valueChanged signal to a spinbox's setValue slot and vice versa.
+    Keeps a slider and a spinbox on one shared value.
+
+    An edit of either widget is mirrored to the other with that widget's signals
+    blocked, so it doesn't echo the value back, and valueChanged is emitted once per
+    edit. Anything derived from the pair connects to the binding instead of the
+    widgets. A value outside the slider's range is clamped by the slider, and the
+    spinbox follows.
+    """
+    valueChanged = pyqtSignal(int)
+
+    def __init__(self, slider: QSlider, spinbox: QSpinBox) -> None:
+        """
+        Binds the pair, starting from the slider's value. The binding lives as long as the slider.
+
+        Args:
+            slider (QSlider): The slider object.
+            spinbox (QSpinBox): The spinbox object.
+        """
+        super().__init__(slider)
+        self.slider = slider
+        self.spinbox = spinbox
+        self._value = slider.value()
+        with QSignalBlocker(spinbox):
+            spinbox.setValue(self._value)
+        slider.valueChanged.connect(self.setValue)
+        spinbox.valueChanged.connect(self.setValue)
+
+    def value(self) -> int:
+        return self._value
+
+    @pyqtSlot(int)
+    def setValue(self, value: int) -> None:
+        """
+        Sets the shared value on both widgets and notifies once if it changed.
+
+        Args:
+            value (int): The new value.
+        """
+        with QSignalBlocker(self.slider), QSignalBlocker(self.spinbox):
+            self.slider.setValue(value)
+            value = self.slider.value()
+            self.spinbox.setValue(value)
+        if value != self._value:
+            self._value = value
+            self.valueChanged.emit(value)
+
+
+def connect_slider_spinbox(slider: QSlider, spinbox: QSpinBox) -> Optional[SliderSpinBinding]:
+    """
+    Binds a slider and a spinbox, so editing either one updates the other.
 
     Parameters:
         slider (QSlider): The slider object.
         spinbox (QSpinBox): The spinbox object.
 
     Returns:
-        None
+        Optional[SliderSpinBinding]: The binding, or None if the widgets can't be bound.
     """
     try:
         if slider is not None and spinbox is not None:
             if isinstance(slider, QSlider) and isinstance(spinbox, QSpinBox):
-                # Connect the slider's valueChanged signal to the spinbox's setValue slot
-                slider.valueChanged.connect(spinbox.setValue)
-                # Connect the spinbox's valueChanged signal to the slider's setValue slot
-                spinbox.valueChanged.connect(slider.setValue)
-                # Add logger to track the success or failure of the connection process
+                return SliderSpinBinding(slider, spinbox)
     except Exception as e:
         logger.error(f"Error connecting signals and slots: {e}")
-        
\ No newline at end of file
+    return None